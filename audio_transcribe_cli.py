@@ -92,44 +92,44 @@ class AudioTranscriberCLI:
                 os.path.basename(args.input)
             )
             if detected_date:
-                date_info = f"Recording Date: {detected_date.strftime('%Y-%m-%d')} ({day_of_week})\n"
+                date_info = f"Recording Date: {detected_date.date().isoformat()} ({day_of_week})\n"
         
         # Build transcript
         file_size = os.path.getsize(args.input) / (1024 * 1024)
-        final_text = f"Transcript of: {os.path.basename(args.input)}\n"
-        final_text += date_info
-        final_text += f"Transcribed: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
-        final_text += "\n--- TRANSCRIPTION METADATA ---\n"
-        final_text += f"File Size:         {file_size:.2f} MB\n"
-        
-        audio_info = AudioUtils.format_audio_info(audio_metadata)
-        if audio_info != "Unknown":
-            final_text += f"Audio Format:      {audio_info}\n"
-        
-        mp3_tags = AudioUtils.format_mp3_tags(audio_metadata)
-        if mp3_tags:
-            final_text += f"MP3 Tags:\n{mp3_tags}\n"
+        parts = [f"Transcript of: {os.path.basename(args.input)}\n"]
+        if date_info:
+            parts.append(date_info)
+        parts.append(f"Transcribed: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        parts.append("\n--- TRANSCRIPTION METADATA ---\n")
+        parts.append(f"File Size:         {file_size:.2f} MB\n")
+        
+        info = AudioUtils.build(audio_metadata)
+        if info.summary:
+            parts.append(f"Audio Format:      {info.summary}\n")
+        if info.mp3_tags:
+            parts.append(f"MP3 Tags:\n{info.mp3_tags}\n")
         
         if duration > 0:
-            final_text += f"Duration:          {FormatUtils.format_time(duration)}\n"
-        final_text += f"Processing Time:   {FormatUtils.format_time(processing_time)}\n"
+            parts.append(f"Duration:          {FormatUtils.format_time(duration)}\n")
+        parts.append(f"Processing Time:   {FormatUtils.format_time(processing_time)}\n")
         if duration > 0 and processing_time > 0:
             speed_ratio = duration / processing_time
-            final_text += f"Speed:             {speed_ratio:.1f}x real-time\n"
-        final_text += f"Engine:            {args.engine}\n"
-        final_text += f"Model:             {args.model}\n"
-        final_text += f"Compute Precision: {args.compute}\n"
+            parts.append(f"Speed:             {speed_ratio:.1f}x real-time\n")
+        parts.append(f"Engine:            {args.engine}\n")
+        parts.append(f"Model:             {args.model}\n")
+        parts.append(f"Compute Precision: {args.compute}\n")
         if self.environment.gpu_available:
             gpu_name = self.environment.get_gpu_info()['name']
-            final_text += f"GPU:               {gpu_name}\n"
+            parts.append(f"GPU:               {gpu_name}\n")
         else:
-            final_text += f"Device:            CPU\n"
-        final_text += f"Language:          {language}\n"
+            parts.append(f"Device:            CPU\n")
+        parts.append(f"Language:          {language}\n")
         if avg_confidence is not None:
             confidence_pct = (1 + avg_confidence) * 100
-            final_text += f"Confidence:        {confidence_pct:.1f}%\n"
-        final_text += "=" * 60 + "\n\n"
-        final_text += text
+            parts.append(f"Confidence:        {confidence_pct:.1f}%\n")
+        parts.append("=" * 60 + "\n\n")
+        parts.append(text)
+        final_text = "".join(parts)
         
         # Determine output file
         if args.output:
@@ -177,6 +177,7 @@ class AudioTranscriberCLI:
         print(f"Compute Type: {args.compute}")
         print(f"Skip existing: {args.skip_existing}")
         print(f"Recursive: {args.recursive}")
+        print(f"Follow symlinks: {args.follow_symlinks}")
         print(f"Preserve structure: {args.preserve_structure}")
         print(f"Create summary: {args.create_summary}")
         print(f"Timestamps enabled: {args.timestamps}")
@@ -192,6 +193,7 @@ class AudioTranscriberCLI:
             'create_summary': args.create_summary,
             'preserve_structure': args.preserve_structure,
             'recursive': args.recursive,
+            'follow_symlinks': args.follow_symlinks,
             'engine': args.engine,
             'model': args.model,
             'compute_type': args.compute,
@@ -391,6 +393,10 @@ Examples:
                               action='store_true', 
                               default=False,
                               help='Search for audio files in all subdirectories of the input folder. If disabled, only processes files directly in the input folder (non-recursive). Combine with --preserve-structure to maintain organization')
+    batch_parser.add_argument('--follow-symlinks', 
+                              action='store_true', 
+                              default=False,
+                              help='Follow symbolic links to files and folders when searching recursively. Folders reachable through multiple links are only searched once. If disabled, symbolic links are ignored')
     batch_parser.add_argument('--timestamps', 
                               action='store_true', 
                               default=False,
@@ -1,6 +1,26 @@
 """Configuration package for Audio Transcriber."""
+import importlib
+
 from .constants import *
-from .environment import Environment
-from .config_manager import ConfigManager
+
+# Exported name -> submodule, imported on first access (PEP 562) so that
+# reading constants does not import torch through the environment module
+_LAZY = {
+    'Environment': 'environment',
+    'ConfigManager': 'config_manager',
+}
 
 __all__ = ['Environment', 'ConfigManager', 'MODEL_SPECS', 'AUDIO_EXTENSIONS']
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module('.' + _LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
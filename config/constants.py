@@ -6,8 +6,12 @@ STATUS_ERROR = "❌"
 STATUS_SKIPPED = "⏭️"
 STATUS_WARNING = "⚠️"
 
-# Audio file extensions supported
-AUDIO_EXTENSIONS = {'.mp3', '.wav', '.m4a', '.flac', '.aac', '.ogg', '.webm'}
+# Audio file extensions supported (lowercase; file_utils matches lowered names against them)
+AUDIO_EXTENSIONS = frozenset({'.mp3', '.wav', '.m4a', '.flac', '.aac', '.ogg', '.webm'})
+
+# System/tool directories never searched during recursive scans
+# (hidden directories such as .git or .Trashes are skipped as well)
+SKIPPED_DIRECTORIES = frozenset({'System Volume Information', '$RECYCLE.BIN', '__MACOSX', 'node_modules'})
 
 # Model specifications for different Whisper model sizes
 MODEL_SPECS = {
@@ -78,6 +82,9 @@ TIMESTAMP_INTERVALS = [15, 30, 60, 120, 300, 600]
 DEFAULT_TIMESTAMP_FORMAT = "HH:MM:SS"
 DEFAULT_TIMESTAMP_INTERVAL = 30  # seconds (30s)
 
+# Idle time before a warm model is unloaded from memory (in seconds)
+MODEL_IDLE_TIMEOUT = 300
+
 # Time constants (in seconds)
 SECONDS_PER_MINUTE = 60
 SECONDS_PER_HOUR = 3600
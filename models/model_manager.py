@@ -1,4 +1,5 @@
 """Model manager for Audio Transcriber."""
+import threading
 import torch
 from pathlib import Path
 from config.environment import WHISPER_AVAILABLE, FASTER_WHISPER_AVAILABLE
@@ -22,56 +23,85 @@ class ModelManager:
         self.environment = environment
         self.whisper_model = None
         self.faster_whisper_model = None
+        # (engine, model_size, compute_type) of the currently loaded model
+        self._loaded_key = None
+        # model_size -> (whisper_downloaded, faster_whisper_downloaded), kept for the session
+        self._download_status = {}
+        # Serializes load/cleanup across the GUI worker threads; re-entrant since load calls cleanup
+        self._lock = threading.RLock()
         
     def load_model(self, engine, model_size, compute_type):
         """Load transcription model.
         
+        Reuses the already loaded model when the resolved engine, model size,
+        and compute type are unchanged.
+        
         Args:
             engine: Engine type (auto_gpu, whisper_gpu, whisper_cpu, faster_whisper_gpu, faster_whisper_cpu).
             model_size: Model size (tiny, base, small, medium, large-v3, turbo).
             compute_type: Compute precision (float16, int8, int8_float16).
         """
-        # Resolve auto_gpu to specific engine
-        actual_engine = engine
-        if engine == "auto_gpu":
-            if FASTER_WHISPER_AVAILABLE and self.environment.gpu_available:
-                actual_engine = "faster_whisper_gpu"
-            elif WHISPER_AVAILABLE and self.environment.gpu_available:
-                actual_engine = "whisper_gpu"
-            elif FASTER_WHISPER_AVAILABLE:
-                actual_engine = "faster_whisper_cpu"
-            elif WHISPER_AVAILABLE:
-                actual_engine = "whisper_cpu"
-        
-        # Load appropriate model
-        if actual_engine.startswith("faster_whisper"):
-            device = "cuda" if actual_engine.endswith("_gpu") and self.environment.gpu_available else "cpu"
-            self.faster_whisper_model = WhisperModel(
-                model_size, device=device, compute_type=compute_type)
-        elif actual_engine.startswith("whisper"):
-            device = self.environment.device if actual_engine.endswith("_gpu") else "cpu"
-            self.whisper_model = whisper.load_model(model_size, device=device)
+        with self._lock:
+            # Resolve auto_gpu to specific engine
+            actual_engine = engine
+            if engine == "auto_gpu":
+                if FASTER_WHISPER_AVAILABLE and self.environment.gpu_available:
+                    actual_engine = "faster_whisper_gpu"
+                elif WHISPER_AVAILABLE and self.environment.gpu_available:
+                    actual_engine = "whisper_gpu"
+                elif FASTER_WHISPER_AVAILABLE:
+                    actual_engine = "faster_whisper_cpu"
+                elif WHISPER_AVAILABLE:
+                    actual_engine = "whisper_cpu"
+            
+            key = (actual_engine, model_size, compute_type)
+            if key == self._loaded_key and self.get_active_model()[0] is not None:
+                return
+            
+            # Drop any previously loaded model before loading a different one
+            self.cleanup_model()
+            
+            # Load appropriate model
+            if actual_engine.startswith("faster_whisper"):
+                device = "cuda" if actual_engine.endswith("_gpu") and self.environment.gpu_available else "cpu"
+                self.faster_whisper_model = WhisperModel(
+                    model_size, device=device, compute_type=compute_type)
+            elif actual_engine.startswith("whisper"):
+                device = self.environment.device if actual_engine.endswith("_gpu") else "cpu"
+                self.whisper_model = whisper.load_model(model_size, device=device)
+            self._loaded_key = key
+            # Loading may have fetched the model into the cache
+            self._download_status.pop(model_size, None)
     
     def cleanup_model(self):
         """Clean up models and free GPU memory."""
-        if self.faster_whisper_model:
-            del self.faster_whisper_model
-            self.faster_whisper_model = None
-        if self.whisper_model:
-            del self.whisper_model
-            self.whisper_model = None
-        if self.environment.gpu_available:
-            torch.cuda.empty_cache()
+        with self._lock:
+            self._loaded_key = None
+            if self.faster_whisper_model:
+                del self.faster_whisper_model
+                self.faster_whisper_model = None
+            if self.whisper_model:
+                del self.whisper_model
+                self.whisper_model = None
+            if self.environment.gpu_available:
+                torch.cuda.empty_cache()
     
     def check_model_downloaded(self, model_size):
         """Check if a model is already downloaded.
         
+        Results are memoized for the session and invalidated when this
+        manager loads or downloads the model.
+        
         Args:
             model_size: Model size to check.
             
         Returns:
             Tuple of (whisper_downloaded, faster_whisper_downloaded).
         """
+        cached = self._download_status.get(model_size)
+        if cached is not None:
+            return cached
+        
         whisper_downloaded = False
         faster_whisper_downloaded = False
         
@@ -92,7 +122,9 @@ class ModelManager:
                     for p in cache_dir.glob("*")
                 )
         
-        return whisper_downloaded, faster_whisper_downloaded
+        result = (whisper_downloaded, faster_whisper_downloaded)
+        self._download_status[model_size] = result
+        return result
     
     def download_model(self, model_size, engine, compute_type):
         """Download a specific model.
@@ -102,31 +134,35 @@ class ModelManager:
             engine: Engine type.
             compute_type: Compute precision.
         """
-        # Resolve auto_gpu
-        actual_engine = engine
-        if engine == "auto_gpu":
-            if FASTER_WHISPER_AVAILABLE and self.environment.gpu_available:
-                actual_engine = "faster_whisper_gpu"
-            elif WHISPER_AVAILABLE and self.environment.gpu_available:
-                actual_engine = "whisper_gpu"
-            elif FASTER_WHISPER_AVAILABLE:
-                actual_engine = "faster_whisper_cpu"
-            elif WHISPER_AVAILABLE:
-                actual_engine = "whisper_cpu"
-        
-        # Download by loading the model
-        if actual_engine.startswith("faster_whisper") and FASTER_WHISPER_AVAILABLE:
-            device = "cuda" if actual_engine.endswith("_gpu") and self.environment.gpu_available else "cpu"
-            temp_model = WhisperModel(model_size, device=device, compute_type=compute_type)
-            del temp_model
-            
-        if actual_engine.startswith("whisper") and WHISPER_AVAILABLE:
-            device = self.environment.device if actual_engine.endswith("_gpu") else "cpu"
-            temp_model = whisper.load_model(model_size, device=device)
-            del temp_model
+        # Held for the whole download so it never builds a model alongside a load
+        # or cleanup, and so _download_status and the CUDA cache stay consistent
+        with self._lock:
+            # Resolve auto_gpu
+            actual_engine = engine
+            if engine == "auto_gpu":
+                if FASTER_WHISPER_AVAILABLE and self.environment.gpu_available:
+                    actual_engine = "faster_whisper_gpu"
+                elif WHISPER_AVAILABLE and self.environment.gpu_available:
+                    actual_engine = "whisper_gpu"
+                elif FASTER_WHISPER_AVAILABLE:
+                    actual_engine = "faster_whisper_cpu"
+                elif WHISPER_AVAILABLE:
+                    actual_engine = "whisper_cpu"
             
-        if self.environment.gpu_available:
-            torch.cuda.empty_cache()
+            # Download by loading the model
+            if actual_engine.startswith("faster_whisper") and FASTER_WHISPER_AVAILABLE:
+                device = "cuda" if actual_engine.endswith("_gpu") and self.environment.gpu_available else "cpu"
+                temp_model = WhisperModel(model_size, device=device, compute_type=compute_type)
+                del temp_model
+                
+            if actual_engine.startswith("whisper") and WHISPER_AVAILABLE:
+                device = self.environment.device if actual_engine.endswith("_gpu") else "cpu"
+                temp_model = whisper.load_model(model_size, device=device)
+                del temp_model
+                
+            self._download_status.pop(model_size, None)
+            if self.environment.gpu_available:
+                torch.cuda.empty_cache()
     
     def get_active_model(self):
         """Get the currently active model.
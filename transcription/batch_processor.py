@@ -7,6 +7,25 @@ from utilities.date_parser import DateParser
 from utilities.audio_utils import AudioUtils
 from config.constants import STATUS_SKIPPED, BYTES_PER_MB
 
+# Transcript header; the *_block and date_info fields are whole lines or empty strings
+_HEADER_TEMPLATE = (
+    "Transcript of: {file_name}\n"
+    "{date_info}"
+    "Transcribed: {now}\n"
+    "\n--- TRANSCRIPTION METADATA ---\n"
+    "File Size:         {file_size:.2f} MB\n"
+    "{audio_block}"
+    "{duration_block}"
+    "Processing Time:   {processing_time}\n"
+    "{speed_block}"
+    "Engine:            {engine}\n"
+    "Model:             {model}\n"
+    "Compute Precision: {compute_type}\n"
+    "Language:          {language}\n"
+    "{confidence_block}"
+    + "=" * 60 + "\n\n"
+)
+
 
 class BatchProcessor:
     """Handles batch processing of multiple audio files."""
@@ -37,8 +56,8 @@ class BatchProcessor:
             input_folder: Input folder path.
             output_folder: Output folder path.
             options: Dictionary of processing options (detect_date, chars_per_line, skip_existing, 
-                    preserve_structure, recursive, create_summary, engine, timestamps_enabled, 
-                    timestamp_format, timestamp_interval).
+                    preserve_structure, recursive, follow_symlinks, create_summary, engine,
+                    timestamps_enabled, timestamp_format, timestamp_interval).
             progress_callback: Optional callback for progress updates (file_num, total, current_file).
             log_callback: Optional callback for log messages.
             
@@ -54,7 +73,11 @@ class BatchProcessor:
         self.start_time = time.time()
         
         # Get audio files
-        audio_files = FileUtils.get_audio_files(input_folder, options.get('recursive', False))
+        audio_files = FileUtils.get_audio_files(
+            input_folder,
+            options.get('recursive', False),
+            follow_symlinks=options.get('follow_symlinks', False)
+        )
         self.total_files = len(audio_files)
         
         if log_callback:
@@ -109,6 +132,7 @@ class BatchProcessor:
             True if successful, False otherwise.
         """
         file_name = os.path.basename(audio_file)
+        stem = os.path.splitext(file_name)[0]
         
         if log_callback:
             log_callback(f"[{self.processed_files}/{self.total_files}] Processing: {file_name}")
@@ -121,8 +145,7 @@ class BatchProcessor:
                 rel_path = FileUtils.get_relative_path(audio_file, input_folder)
                 output_file = os.path.join(output_folder, os.path.splitext(rel_path)[0] + '.txt')
             else:
-                base_name = os.path.splitext(file_name)[0]
-                output_file = os.path.join(output_folder, base_name + '.txt')
+                output_file = os.path.join(output_folder, stem + '.txt')
             
             # Skip if exists
             if options.get('skip_existing', True) and os.path.exists(output_file):
@@ -163,51 +186,38 @@ class BatchProcessor:
             detected_date = None
             day_of_week = None
             if options.get('detect_date', True):
-                detected_date, day_of_week = DateParser.detect_date_from_filename(file_name)
+                detected_date, day_of_week = DateParser.detect_date_from_stem(stem)
             
             # Calculate processing time
             process_time = time.time() - start_time
             self.processing_times.append(process_time)
             
+            # Optional header lines are whole lines or empty strings
+            info = AudioUtils.build(audio_metadata)
+            header = _HEADER_TEMPLATE.format_map({
+                'file_name': file_name,
+                'date_info': f"Recording Date: {detected_date.date().isoformat()} ({day_of_week})\n"
+                             if detected_date else "",
+                'now': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'file_size': file_size,
+                'audio_block': (f"Audio Format:      {info.summary}\n" if info.summary else "") +
+                               (f"MP3 Tags:\n{info.mp3_tags}\n" if info.mp3_tags else ""),
+                'duration_block': f"Duration:          {FormatUtils.format_time(duration)}\n"
+                                  if duration > 0 else "",
+                'processing_time': FormatUtils.format_time(process_time),
+                'speed_block': f"Speed:             {duration / process_time:.1f}x real-time\n"
+                               if duration > 0 and process_time > 0 else "",
+                'engine': options.get('engine', 'auto_gpu'),
+                'model': options.get('model', 'base'),
+                'compute_type': options.get('compute_type', 'float16'),
+                'language': language,
+                'confidence_block': f"Confidence:        {(1 + avg_confidence) * 100:.1f}%\n"
+                                    if avg_confidence is not None else "",
+            })
+            
             # Save with comprehensive metadata
             with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(f"Transcript of: {file_name}\n")
-                
-                if detected_date:
-                    f.write(f"Recording Date: {detected_date.strftime('%Y-%m-%d')} ({day_of_week})\n")
-                
-                f.write(f"Transcribed: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("\n--- TRANSCRIPTION METADATA ---\n")
-                f.write(f"File Size:         {file_size:.2f} MB\n")
-                
-                # Add audio format information
-                audio_info = AudioUtils.format_audio_info(audio_metadata)
-                if audio_info != "Unknown":
-                    f.write(f"Audio Format:      {audio_info}\n")
-                
-                # Add MP3 tag information if available
-                mp3_tags = AudioUtils.format_mp3_tags(audio_metadata)
-                if mp3_tags:
-                    f.write(f"MP3 Tags:\n{mp3_tags}\n")
-                
-                if duration > 0:
-                    f.write(f"Duration:          {FormatUtils.format_time(duration)}\n")
-                f.write(f"Processing Time:   {FormatUtils.format_time(process_time)}\n")
-                
-                if duration > 0 and process_time > 0:
-                    speed_ratio = duration / process_time
-                    f.write(f"Speed:             {speed_ratio:.1f}x real-time\n")
-                
-                f.write(f"Engine:            {options.get('engine', 'auto_gpu')}\n")
-                f.write(f"Model:             {options.get('model', 'base')}\n")
-                f.write(f"Compute Precision: {options.get('compute_type', 'float16')}\n")
-                f.write(f"Language:          {language}\n")
-                
-                if avg_confidence is not None:
-                    confidence_pct = (1 + avg_confidence) * 100
-                    f.write(f"Confidence:        {confidence_pct:.1f}%\n")
-                
-                f.write("=" * 60 + "\n\n")
+                f.write(header)
                 f.write(formatted_text)
             
             if log_callback:
@@ -1,7 +1,10 @@
 """Main application window for Audio Transcriber."""
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk
 from config import Environment, ConfigManager
+from config.constants import MODEL_IDLE_TIMEOUT
 from models import ModelManager
 from transcription import Transcriber, BatchProcessor
 from ui.tabs import SingleFileTab, BatchTab, ModelConfigTab, AboutTab
@@ -28,6 +31,16 @@ class AudioTranscriberApp:
         self.transcriber = Transcriber(self.model_manager, self.environment)
         self.batch_processor = BatchProcessor(self.transcriber, self.model_manager)
         
+        # Long-lived worker so the loaded model stays warm between jobs; a daemon
+        # thread so closing the window never waits for a running transcription
+        self.closing = False
+        self._jobs = queue.Queue()
+        self._worker = threading.Thread(target=self._run_jobs, name="transcriber", daemon=True)
+        self._worker.start()
+        self._unload_after = None
+        # Notebook tab indexes currently disabled by freeze_other_tabs
+        self._frozen_tabs = ()
+        
         # Shared configuration variables
         self.engine = tk.StringVar(value="auto_gpu")
         self.model_size = tk.StringVar(value="base")
@@ -76,14 +89,72 @@ class AudioTranscriberApp:
         Args:
             active_tab_index: Index of the active tab (0=Single File, 1=Batch, 2=Config).
         """
-        for i in range(self.notebook.index('end')):
-            if i != active_tab_index:
-                self.notebook.tab(i, state='disabled')
+        self._frozen_tabs = tuple(i for i in range(self.notebook.index('end')) if i != active_tab_index)
+        for i in self._frozen_tabs:
+            self.notebook.tab(i, state='disabled')
     
     def unfreeze_all_tabs(self):
-        """Re-enable all tabs after processing completes."""
-        for i in range(self.notebook.index('end')):
+        """Re-enable the tabs disabled by freeze_other_tabs."""
+        for i in self._frozen_tabs:
             self.notebook.tab(i, state='normal')
+        self._frozen_tabs = ()
+    
+    def submit_job(self, func, *args):
+        """Queue a job for the worker thread; jobs run one at a time, in order.
+        
+        Args:
+            func: Callable to run on the worker thread.
+            *args: Positional arguments for func.
+        """
+        if not self.closing:
+            self._jobs.put((func, args))
+    
+    def _run_jobs(self):
+        """Worker thread loop: run queued jobs until the None sentinel arrives."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            func, args = job
+            try:
+                func(*args)
+            except Exception as e:
+                import logging
+                logging.error(f"Background job failed: {e}")
+    
+    def call_in_ui(self, callback, *args):
+        """Schedule a callback on the Tk thread from a worker thread.
+        
+        Does nothing once the window is closing, since the Tk root may already
+        be destroyed.
+        
+        Args:
+            callback: Callable to run on the Tk thread.
+            *args: Positional arguments for callback.
+        """
+        if self.closing:
+            return
+        try:
+            self.root.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            # Root destroyed between the check and the call
+            pass
+    
+    def schedule_model_unload(self):
+        """Unload the model after MODEL_IDLE_TIMEOUT seconds without new jobs."""
+        self.cancel_model_unload()
+        self._unload_after = self.root.after(MODEL_IDLE_TIMEOUT * 1000, self._unload_idle_model)
+    
+    def cancel_model_unload(self):
+        """Cancel a pending idle model unload."""
+        if self._unload_after:
+            self.root.after_cancel(self._unload_after)
+            self._unload_after = None
+    
+    def _unload_idle_model(self):
+        """Free the idle model on the worker thread, after any queued jobs."""
+        self._unload_after = None
+        self.submit_job(self.model_manager.cleanup_model)
     
     def save_config(self):
         """Save application configuration."""
@@ -131,13 +202,16 @@ class AudioTranscriberApp:
                 # Batch tab
                 batch_config = {
                     'input_folder': config.get('batch_input_folder'),
+                    'input_mtime_ns': config.get('batch_input_mtime_ns'),
+                    'input_count': config.get('batch_input_count'),
                     'output_folder': config.get('batch_output_folder'),
                     'detect_date': config.get('batch_detect_date', True),
                     'chars_per_line': config.get('batch_chars_per_line', 80),
                     'skip_existing': config.get('batch_skip_existing', True),
                     'create_summary': config.get('batch_create_summary', True),
                     'preserve_structure': config.get('batch_preserve_structure', False),
-                    'recursive': config.get('batch_recursive', False)
+                    'recursive': config.get('batch_recursive', False),
+                    'follow_symlinks': config.get('batch_follow_symlinks', False)
                 }
                 self.batch_tab.set_config(batch_config)
         except Exception:
@@ -145,5 +219,17 @@ class AudioTranscriberApp:
     
     def on_closing(self):
         """Handle window closing."""
+        self.closing = True
         self.save_config()
+        self.cancel_model_unload()
+        self.batch_processor.cancel()
+        self.single_file_tab.cancel_requested = True
+        self.single_file_tab.discard_transcript()
+        # Drop queued jobs and stop the worker after the running one, if any
+        try:
+            while True:
+                self._jobs.get_nowait()
+        except queue.Empty:
+            pass
+        self._jobs.put(None)
         self.root.destroy()
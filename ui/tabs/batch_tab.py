@@ -2,12 +2,142 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
 import os
-import time
 import threading
+import time
+from functools import partial
 from utilities.file_utils import FileUtils
 from utilities.format_utils import FormatUtils
 from config.constants import TIMESTAMP_FORMATS, TIMESTAMP_INTERVALS, DEFAULT_TIMESTAMP_FORMAT, DEFAULT_TIMESTAMP_INTERVAL
 
+# Help dialog (title, text) for each option's "?" button
+_HELP = {
+    'date': (
+        "Date Detection Help",
+        "Date Detection from Filename\n\n"
+        "This feature automatically extracts the recording date from the audio filename.\n\n"
+        "Supported formats:\n"
+        "  • YYYY-MM-DD  (e.g., 2024-03-15.mp3)\n"
+        "  • YYYYMMDD    (e.g., 20240315.mp3)\n"
+        "  • MM-DD-YYYY  (e.g., 03-15-2024.mp3)\n"
+        "  • Month DD YYYY (e.g., March_15_2024.mp3)\n\n"
+        "If a date is detected:\n"
+        "  • The date and day of week are added to the transcript header\n"
+        "  • Format: YYYY-MM-DD (DayOfWeek)\n\n"
+        "If no date is found, the transcript is created without date information."
+    ),
+    'chars_per_line': (
+        "Characters Per Line Help",
+        "Characters Per Line\n\n"
+        "Controls text formatting in the transcript by adding line breaks.\n\n"
+        "How it works:\n"
+        "  • Breaks long paragraphs into shorter lines\n"
+        "  • Never breaks in the middle of a word\n"
+        "  • Preserves natural paragraph breaks\n\n"
+        "Settings:\n"
+        "  • 80 characters (default): Good for most uses\n"
+        "  • 0: No line breaks - keeps original formatting\n"
+        "  • Higher values: Longer lines before wrapping\n\n"
+        "Tip: Use 0 if you want continuous text without artificial breaks."
+    ),
+    'skip_existing': (
+        "Skip Existing Help",
+        "Skip Existing Transcripts\n\n"
+        "Controls whether to re-process files that already have transcripts.\n\n"
+        "When enabled:\n"
+        "  • Checks if a .txt file already exists for each audio file\n"
+        "  • Skips files that have been previously transcribed\n"
+        "  • Saves processing time on large batches\n\n"
+        "When disabled:\n"
+        "  • Processes all audio files, even if transcripts exist\n"
+        "  • Overwrites existing transcript files\n\n"
+        "Use Case:\n"
+        "  • Enable to add new files to a partially processed folder\n"
+        "  • Disable to regenerate all transcripts with new settings"
+    ),
+    'summary': (
+        "Summary Report Help",
+        "Create Summary Report\n\n"
+        "Generates a detailed summary file after batch processing completes.\n\n"
+        "Summary file contents:\n"
+        "  • Total files processed and skipped\n"
+        "  • Total processing time\n"
+        "  • List of all processed files with status\n"
+        "  • Any errors or warnings encountered\n\n"
+        "File location:\n"
+        "  • Saved in output folder as '_batch_summary.txt'\n"
+        "  • Timestamped for reference\n\n"
+        "Useful for:\n"
+        "  • Tracking batch processing history\n"
+        "  • Verifying all files were processed\n"
+        "  • Identifying any issues during processing"
+    ),
+    'preserve_structure': (
+        "Folder Structure Help",
+        "Preserve Folder Structure\n\n"
+        "Maintains the original directory hierarchy in the output folder.\n\n"
+        "When enabled:\n"
+        "  • Recreates input folder structure in output location\n"
+        "  • Example: input/2024/january/file.mp3\n"
+        "    → output/2024/january/file.txt\n\n"
+        "When disabled:\n"
+        "  • All transcripts are saved directly in output folder\n"
+        "  • Example: input/2024/january/file.mp3\n"
+        "    → output/file.txt\n\n"
+        "Use Case:\n"
+        "  • Enable when organizing files by date or category\n"
+        "  • Disable for a flat output structure\n\n"
+        "Note: Works best with 'Recursive' option enabled."
+    ),
+    'recursive': (
+        "Recursive Search Help",
+        "Recursively Check for Audio Files\n\n"
+        "Controls whether to search subdirectories for audio files.\n\n"
+        "When enabled:\n"
+        "  • Searches input folder and all subdirectories\n"
+        "  • Finds audio files at any depth\n"
+        "  • Example: processes files in input/, input/2024/, input/2024/jan/, etc.\n"
+        "  • Hidden and system folders (.git, $RECYCLE.BIN, etc.) are skipped\n\n"
+        "When disabled:\n"
+        "  • Only processes files directly in input folder\n"
+        "  • Ignores subdirectories\n"
+        "  • Example: only processes files in input/\n\n"
+        "Use Case:\n"
+        "  • Enable for organized hierarchical folders\n"
+        "  • Disable when all files are in one location\n\n"
+        "Tip: Combine with 'Preserve folder structure' to maintain organization."
+    ),
+    'follow_symlinks': (
+        "Follow Symbolic Links Help",
+        "Follow Symbolic Links\n\n"
+        "Controls whether symbolic links are followed during recursive searches.\n\n"
+        "When enabled:\n"
+        "  • Linked folders are searched and linked audio files are included\n"
+        "  • Folders reached through more than one link are only searched once\n\n"
+        "When disabled (default):\n"
+        "  • Symbolic links are ignored\n"
+        "  • Fastest option, and avoids link loops in music libraries\n\n"
+        "Note: Only applies when 'Recursive' is enabled."
+    ),
+    'timestamps': (
+        "Timestamp Help",
+        "Timestamp Options\n\n"
+        "Adds timestamps at regular intervals throughout transcripts.\n\n"
+        "Format Options:\n"
+        "  • HH:MM:SS - Standard format (e.g., [01:23:45])\n"
+        "  • MM:SS - Minutes and seconds only (e.g., [83:45])\n"
+        "  • timecode - Includes milliseconds (e.g., [01:23:45.678])\n\n"
+        "Interval Options:\n"
+        "  • 15, 30, 60, 120, 300, 600 seconds\n"
+        "  • Timestamps appear at the start of their own line\n"
+        "  • First timestamp is always at 00:00:00\n\n"
+        "Use timestamps to:\n"
+        "  • Navigate long transcripts easily\n"
+        "  • Reference specific parts of the audio\n"
+        "  • Create timestamped notes\n\n"
+        "Note: Timestamps are disabled by default."
+    ),
+}
+
 
 class BatchTab:
     """Batch processing tab UI."""
@@ -23,6 +153,10 @@ class BatchTab:
         # State variables
         self.input_folder = None
         self.output_folder = None
+        # Last input folder scan: ((folder, recursive, follow_symlinks, mtime_ns), files or None, count)
+        self._audio_cache = None
+        # Cache key of the recursive count running on a background thread, if any
+        self._counting_key = None
         
         # Configuration variables
         self.detect_date = tk.BooleanVar(value=True)
@@ -31,10 +165,14 @@ class BatchTab:
         self.create_summary = tk.BooleanVar(value=True)
         self.preserve_structure = tk.BooleanVar(value=False)
         self.recursive = tk.BooleanVar(value=False)
+        self.follow_symlinks = tk.BooleanVar(value=False)
         self.timestamps_enabled = tk.BooleanVar(value=False)
         self.timestamp_format = tk.StringVar(value=DEFAULT_TIMESTAMP_FORMAT)
         self.timestamp_interval = tk.IntVar(value=DEFAULT_TIMESTAMP_INTERVAL)
         
+        # Pending debounced config save (Tk after id)
+        self._save_after = None
+        
         self._create_ui()
     
     def _create_ui(self):
@@ -84,63 +222,73 @@ class BatchTab:
         date_frame.grid(row=0, column=0, sticky="w", padx=(0, 15))
         
         ttk.Checkbutton(date_frame, text="Detect recording date from filename",
-                       variable=self.detect_date, command=self.app.save_config).grid(
+                       variable=self.detect_date, command=self._debounced_save).grid(
                            row=0, column=0, sticky="w")
         
-        help_btn = ttk.Button(date_frame, text="?", width=3, command=self.show_date_detection_help)
+        help_btn = ttk.Button(date_frame, text="?", width=3, command=lambda: self._show_help('date'))
         help_btn.grid(row=0, column=1, padx=(5, 0))
         
         format_frame = ttk.Frame(opts_grid)
         format_frame.grid(row=0, column=1, sticky="w", padx=(0, 15))
         ttk.Label(format_frame, text="Characters per line:").grid(row=0, column=0, sticky="w")
         words_spin = ttk.Spinbox(format_frame, from_=0, to=200, width=8,
-                                textvariable=self.chars_per_line, command=self.app.save_config)
+                                textvariable=self.chars_per_line)
         words_spin.grid(row=0, column=1, padx=(5, 5))
-        self.chars_per_line.trace_add('write', lambda *args: self.app.save_config())
+        # Arrow clicks and typing both write the variable, so the trace covers both
+        self.chars_per_line.trace_add('write', lambda *args: self._debounced_save())
         ttk.Label(format_frame, text="(0 = no breaks)", foreground="gray",
                  font=("Arial", 8)).grid(row=0, column=2, sticky="w")
-        help_btn2 = ttk.Button(format_frame, text="?", width=3, command=self.show_chars_per_line_help)
+        help_btn2 = ttk.Button(format_frame, text="?", width=3, command=lambda: self._show_help('chars_per_line'))
         help_btn2.grid(row=0, column=3, padx=(5, 0))
         
         # Skip existing with help button
         skip_frame = ttk.Frame(opts_grid)
         skip_frame.grid(row=1, column=0, sticky="w", padx=(0, 15), pady=(5, 0))
         ttk.Checkbutton(skip_frame, text="Skip existing transcripts",
-                       variable=self.skip_existing, command=self.app.save_config).grid(
+                       variable=self.skip_existing, command=self._debounced_save).grid(
                            row=0, column=0, sticky="w")
-        ttk.Button(skip_frame, text="?", width=3, command=self.show_skip_existing_help).grid(
+        ttk.Button(skip_frame, text="?", width=3, command=lambda: self._show_help('skip_existing')).grid(
             row=0, column=1, padx=(5, 0))
         
         # Create summary with help button
         summary_frame = ttk.Frame(opts_grid)
         summary_frame.grid(row=1, column=1, sticky="w", padx=(0, 15), pady=(5, 0))
         ttk.Checkbutton(summary_frame, text="Create summary report",
-                       variable=self.create_summary, command=self.app.save_config).grid(
+                       variable=self.create_summary, command=self._debounced_save).grid(
                            row=0, column=0, sticky="w")
-        ttk.Button(summary_frame, text="?", width=3, command=self.show_summary_help).grid(
+        ttk.Button(summary_frame, text="?", width=3, command=lambda: self._show_help('summary')).grid(
             row=0, column=1, padx=(5, 0))
         
         # Preserve structure with help button
         preserve_frame = ttk.Frame(opts_grid)
         preserve_frame.grid(row=2, column=0, sticky="w", padx=(0, 15), pady=(5, 0))
         ttk.Checkbutton(preserve_frame, text="Preserve folder structure",
-                       variable=self.preserve_structure, command=self.app.save_config).grid(
+                       variable=self.preserve_structure, command=self._debounced_save).grid(
                            row=0, column=0, sticky="w")
-        ttk.Button(preserve_frame, text="?", width=3, command=self.show_preserve_structure_help).grid(
+        ttk.Button(preserve_frame, text="?", width=3, command=lambda: self._show_help('preserve_structure')).grid(
             row=0, column=1, padx=(5, 0))
         
         # Recursive with help button
         recursive_frame = ttk.Frame(opts_grid)
         recursive_frame.grid(row=2, column=1, sticky="w", pady=(5, 0))
         ttk.Checkbutton(recursive_frame, text="Recursively check for audio files",
-                       variable=self.recursive, command=self.app.save_config).grid(
+                       variable=self.recursive, command=self._debounced_save).grid(
                            row=0, column=0, sticky="w")
-        ttk.Button(recursive_frame, text="?", width=3, command=self.show_recursive_help).grid(
+        ttk.Button(recursive_frame, text="?", width=3, command=lambda: self._show_help('recursive')).grid(
+            row=0, column=1, padx=(5, 0))
+        
+        # Follow symlinks with help button
+        symlinks_frame = ttk.Frame(opts_grid)
+        symlinks_frame.grid(row=3, column=0, sticky="w", padx=(0, 15), pady=(5, 0))
+        ttk.Checkbutton(symlinks_frame, text="Follow symbolic links",
+                       variable=self.follow_symlinks, command=self._debounced_save).grid(
+                           row=0, column=0, sticky="w")
+        ttk.Button(symlinks_frame, text="?", width=3, command=lambda: self._show_help('follow_symlinks')).grid(
             row=0, column=1, padx=(5, 0))
         
         # Timestamp options
         timestamp_frame = ttk.Frame(opts_grid)
-        timestamp_frame.grid(row=3, column=0, columnspan=2, sticky="w", pady=(10, 0))
+        timestamp_frame.grid(row=4, column=0, columnspan=2, sticky="w", pady=(10, 0))
         
         self.timestamps_checkbox = ttk.Checkbutton(
             timestamp_frame, 
@@ -159,7 +307,7 @@ class BatchTab:
             width=12
         )
         self.format_combo.grid(row=0, column=2, sticky="w")
-        self.format_combo.bind('<<ComboboxSelected>>', lambda e: self.app.save_config())
+        self.format_combo.bind('<<ComboboxSelected>>', lambda e: self._debounced_save())
         
         ttk.Label(timestamp_frame, text="Interval:").grid(row=0, column=3, sticky="w", padx=(20, 5))
         self.interval_combo = ttk.Combobox(
@@ -170,12 +318,12 @@ class BatchTab:
             width=8
         )
         self.interval_combo.grid(row=0, column=4, sticky="w")
-        self.interval_combo.bind('<<ComboboxSelected>>', lambda e: self.app.save_config())
+        self.interval_combo.bind('<<ComboboxSelected>>', lambda e: self._debounced_save())
         
         ttk.Label(timestamp_frame, text="seconds", foreground="gray", font=("Arial", 8)).grid(
             row=0, column=5, sticky="w", padx=(5, 0))
         
-        ttk.Button(timestamp_frame, text="?", width=3, command=self.show_timestamp_help).grid(
+        ttk.Button(timestamp_frame, text="?", width=3, command=lambda: self._show_help('timestamps')).grid(
             row=0, column=6, padx=(5, 0))
         
         # Initially disable timestamp controls
@@ -241,11 +389,11 @@ class BatchTab:
         if folder:
             self.input_folder = folder
             self.input_label.config(text=folder, foreground="black")
-            audio_files = FileUtils.get_audio_files(folder, self.recursive.get())
+            audio_files = self._scan_input(force=True)
             self.log(f"📁 Input folder selected: {folder}")
             self.log(f"📊 Found {len(audio_files)} audio file(s)")
             self.check_ready()
-            self.app.save_config()
+            self._debounced_save()
     
     def select_output(self):
         """Select output folder."""
@@ -255,44 +403,143 @@ class BatchTab:
             self.output_label.config(text=folder, foreground="black")
             self.log(f"📁 Output folder selected: {folder}")
             self.check_ready()
-            self.app.save_config()
+            self._debounced_save()
     
     def check_ready(self):
         """Check if batch processing is ready."""
         if self.input_folder and self.output_folder:
-            audio_files = FileUtils.get_audio_files(self.input_folder, self.recursive.get())
-            if len(audio_files) > 0:
+            count = self._audio_count()
+            if count is None and self.recursive.get():
+                # Counting a whole tree can take a while; finish it off the Tk thread
+                self.start_btn.config(state="disabled")
+                self.status.set("Counting audio files...")
+                self._start_count()
+                return
+            if count is None:
+                count = len(self._scan_input(force=True))
+            if count > 0:
                 self.start_btn.config(state="normal")
-                self.status.set(f"Ready - {len(audio_files)} file(s) to process")
+                self.status.set(f"Ready - {count} file(s) to process")
             else:
                 self.start_btn.config(state="disabled")
                 self.status.set("No audio files found")
         else:
             self.start_btn.config(state="disabled")
     
+    def _input_cache_key(self):
+        """Get the cache key for the current input folder scan.
+        
+        Returns:
+            Tuple of (folder, recursive, follow_symlinks, folder mtime in ns),
+            or None if the folder is unreadable.
+        """
+        try:
+            mtime_ns = os.stat(self.input_folder).st_mtime_ns
+        except (OSError, TypeError):
+            return None
+        return (self.input_folder, self.recursive.get(), self.follow_symlinks.get(), mtime_ns)
+    
+    def _scan_input(self, force=False):
+        """Get audio files in the input folder, reusing the last scan when unchanged.
+        
+        Args:
+            force: Whether to rescan even if the cached scan is still valid.
+            
+        Returns:
+            Sorted list of audio file paths.
+        """
+        key = self._input_cache_key()
+        if not force and key and self._audio_cache and self._audio_cache[0] == key \
+                and self._audio_cache[1] is not None:
+            return self._audio_cache[1]
+        
+        audio_files = FileUtils.get_audio_files(
+            self.input_folder, self.recursive.get(), follow_symlinks=self.follow_symlinks.get())
+        self._audio_cache = (key, audio_files, len(audio_files)) if key else None
+        return audio_files
+    
+    def _audio_count(self):
+        """Get the cached number of audio files in the input folder, without scanning.
+        
+        Uses the cached count (possibly restored from the config file) when the
+        folder's mtime is unchanged. Folder mtime only tracks direct children,
+        so the batch processor still enumerates the files before processing.
+        
+        Returns:
+            The cached count, or None if it must be rescanned. A zero restored
+            from the config file is not trusted, so a stale count can't keep
+            Start disabled.
+        """
+        key = self._input_cache_key()
+        if key and self._audio_cache and self._audio_cache[0] == key \
+                and (self._audio_cache[2] > 0 or self._audio_cache[1] is not None):
+            return self._audio_cache[2]
+        return None
+    
+    def _start_count(self):
+        """Count the audio files for the current settings on a background thread."""
+        key = self._input_cache_key()
+        if key is None or key == self._counting_key:
+            return
+        self._counting_key = key
+        threading.Thread(target=self._count_worker, args=(key,), daemon=True).start()
+    
+    def _count_worker(self, key):
+        """Scan the input folder for _start_count and report back on the Tk thread.
+        
+        Args:
+            key: Cache key the scan was started for.
+        """
+        folder, recursive, follow_symlinks, _ = key
+        audio_files = FileUtils.get_audio_files(folder, recursive, follow_symlinks=follow_symlinks)
+        self.app.call_in_ui(self._on_count_done, key, audio_files)
+    
+    def _on_count_done(self, key, audio_files):
+        """Store a background count if the settings are unchanged, then refresh.
+        
+        Args:
+            key: Cache key the scan was started for.
+            audio_files: Audio files found by the scan.
+        """
+        if key == self._counting_key:
+            self._counting_key = None
+        if key == self._input_cache_key():
+            self._audio_cache = (key, audio_files, len(audio_files))
+            self._debounced_save()
+        self.check_ready()
+    
     def start_batch(self):
         """Start batch processing."""
-        audio_files = FileUtils.get_audio_files(self.input_folder, self.recursive.get())
+        # The count comes from the last scan; the batch processor enumerates
+        # the files itself on the worker thread once the user confirms, so the
+        # tree is not walked a second time here
+        count = self._audio_count()
+        if count is None and not self.recursive.get():
+            count = len(self._scan_input(force=True))
+        files_text = f"{count} file(s)" if count is not None else "all audio files in the folder tree"
         
         if not messagebox.askyesno("Start Batch Processing",
-                                   f"Process {len(audio_files)} file(s)?\n\n"
+                                   f"Process {files_text}?\n\n"
                                    f"Engine: {self.app.engine.get()}\n"
                                    f"Model: {self.app.model_size.get()}"):
             return
         
         self.start_btn.config(state="disabled")
         self.cancel_btn.config(state="normal")
-        self.overall_progress['maximum'] = len(audio_files)
+        # Without a count the first progress callback sets the real maximum
+        self.overall_progress['maximum'] = count or 1
         self.overall_progress['value'] = 0
         
         self.app.freeze_other_tabs(1)
         
         self.log("=" * 80)
         self.log("🚀 Starting batch transcription...")
-        self.log(f"📊 Total files: {len(audio_files)}")
+        if count is not None:
+            self.log(f"📊 Total files: {count}")
         self.log("=" * 80)
         
-        threading.Thread(target=self._batch_worker, daemon=True).start()
+        self.app.cancel_model_unload()
+        self.app.submit_job(self._batch_worker)
     
     def _batch_worker(self):
         """Batch processing worker thread."""
@@ -311,6 +558,7 @@ class BatchTab:
                 'skip_existing': self.skip_existing.get(),
                 'preserve_structure': self.preserve_structure.get(),
                 'recursive': self.recursive.get(),
+                'follow_symlinks': self.follow_symlinks.get(),
                 'create_summary': self.create_summary.get(),
                 'engine': self.app.engine.get(),
                 'model': self.app.model_size.get(),
@@ -338,27 +586,28 @@ class BatchTab:
             self.log("=" * 80)
             
             if not self.app.batch_processor.cancel_requested:
-                self.app.root.after(0, lambda: messagebox.showinfo(
-                    "Batch Complete",
+                self.app.call_in_ui(partial(
+                    messagebox.showinfo, "Batch Complete",
                     f"Successfully processed {results['successful']}/{results['total']} files"))
         
         except Exception as e:
             self.log(f"\n❌ Error: {e}")
-            self.app.root.after(0, lambda e=e: messagebox.showerror("Error", f"Batch failed: {e}"))
+            self.app.call_in_ui(partial(messagebox.showerror, "Error", f"Batch failed: {e}"))
         finally:
-            self.app.model_manager.cleanup_model()
-            self.app.root.after(0, self._reset_ui)
-            self.app.root.after(0, self.app.unfreeze_all_tabs)
+            # Keep the model warm for the next batch; it is freed after an idle timeout
+            self.app.call_in_ui(self.app.schedule_model_unload)
+            self.app.call_in_ui(self._reset_ui)
+            self.app.call_in_ui(self.app.unfreeze_all_tabs)
     
     def _update_progress(self, current, total, current_file):
         """Update progress."""
-        self.app.root.after(0, lambda: self.overall_progress.configure(value=current))
-        self.app.root.after(0, self.current_progress.start)
+        self.app.call_in_ui(partial(self.overall_progress.configure, maximum=total, value=current))
+        self.app.call_in_ui(self.current_progress.start)
         
         stats = self.app.batch_processor.get_statistics()
         stats_text = (f"Processing: {current}/{total} | "
                      f"Success: {stats['successful']} | Failed: {stats['failed']}")
-        self.app.root.after(0, lambda: self.stats_label.config(text=stats_text))
+        self.app.call_in_ui(partial(self.stats_label.config, text=stats_text))
         
         if len(stats['processing_times']) >= 2:
             avg_time = sum(stats['processing_times']) / len(stats['processing_times'])
@@ -366,7 +615,7 @@ class BatchTab:
             eta = avg_time * remaining
             elapsed = time.time() - self.app.batch_processor.start_time
             eta_text = f"ETA: {FormatUtils.format_time(eta)} | Elapsed: {FormatUtils.format_time(elapsed)}"
-            self.app.root.after(0, lambda: self.eta_label.config(text=eta_text))
+            self.app.call_in_ui(partial(self.eta_label.config, text=eta_text))
     
     def cancel_batch(self):
         """Cancel batch processing."""
@@ -385,157 +634,53 @@ class BatchTab:
         """Add message to log."""
         timestamp = time.strftime("%H:%M:%S")
         log_msg = f"[{timestamp}] {message}\n"
-        self.app.root.after(0, lambda: self.log_text.insert(tk.END, log_msg))
-        self.app.root.after(0, lambda: self.log_text.see(tk.END))
+        self.app.call_in_ui(self.log_text.insert, tk.END, log_msg)
+        self.app.call_in_ui(self.log_text.see, tk.END)
     
     def clear_log(self):
         """Clear log."""
         self.log_text.delete("1.0", tk.END)
     
-    def show_date_detection_help(self):
-        """Show help dialog for date detection feature."""
-        help_text = (
-            "Date Detection from Filename\n\n"
-            "This feature automatically extracts the recording date from the audio filename.\n\n"
-            "Supported formats:\n"
-            "  • YYYY-MM-DD  (e.g., 2024-03-15.mp3)\n"
-            "  • YYYYMMDD    (e.g., 20240315.mp3)\n"
-            "  • MM-DD-YYYY  (e.g., 03-15-2024.mp3)\n"
-            "  • Month DD YYYY (e.g., March_15_2024.mp3)\n\n"
-            "If a date is detected:\n"
-            "  • The date and day of week are added to the transcript header\n"
-            "  • Format: YYYY-MM-DD (DayOfWeek)\n\n"
-            "If no date is found, the transcript is created without date information."
-        )
-        messagebox.showinfo("Date Detection Help", help_text, parent=self.frame)
+    def _show_help(self, key):
+        """Show the help dialog for an option.
+        
+        Args:
+            key: Key into the module-level _HELP table.
+        """
+        title, help_text = _HELP[key]
+        messagebox.showinfo(title, help_text, parent=self.frame)
     
-    def show_chars_per_line_help(self):
-        """Show help dialog for characters per line feature."""
-        help_text = (
-            "Characters Per Line\n\n"
-            "Controls text formatting in the transcript by adding line breaks.\n\n"
-            "How it works:\n"
-            "  • Breaks long paragraphs into shorter lines\n"
-            "  • Never breaks in the middle of a word\n"
-            "  • Preserves natural paragraph breaks\n\n"
-            "Settings:\n"
-            "  • 80 characters (default): Good for most uses\n"
-            "  • 0: No line breaks - keeps original formatting\n"
-            "  • Higher values: Longer lines before wrapping\n\n"
-            "Tip: Use 0 if you want continuous text without artificial breaks."
-        )
-        messagebox.showinfo("Characters Per Line Help", help_text, parent=self.frame)
+    def _debounced_save(self):
+        """Schedule a config save, coalescing bursts of UI changes into one write."""
+        if self._save_after:
+            self.frame.after_cancel(self._save_after)
+        self._save_after = self.frame.after(500, self._flush_save)
     
-    def show_skip_existing_help(self):
-        """Show help dialog for skip existing feature."""
-        help_text = (
-            "Skip Existing Transcripts\n\n"
-            "Controls whether to re-process files that already have transcripts.\n\n"
-            "When enabled:\n"
-            "  • Checks if a .txt file already exists for each audio file\n"
-            "  • Skips files that have been previously transcribed\n"
-            "  • Saves processing time on large batches\n\n"
-            "When disabled:\n"
-            "  • Processes all audio files, even if transcripts exist\n"
-            "  • Overwrites existing transcript files\n\n"
-            "Use Case:\n"
-            "  • Enable to add new files to a partially processed folder\n"
-            "  • Disable to regenerate all transcripts with new settings"
-        )
-        messagebox.showinfo("Skip Existing Help", help_text, parent=self.frame)
-    
-    def show_summary_help(self):
-        """Show help dialog for summary report feature."""
-        help_text = (
-            "Create Summary Report\n\n"
-            "Generates a detailed summary file after batch processing completes.\n\n"
-            "Summary file contents:\n"
-            "  • Total files processed and skipped\n"
-            "  • Total processing time\n"
-            "  • List of all processed files with status\n"
-            "  • Any errors or warnings encountered\n\n"
-            "File location:\n"
-            "  • Saved in output folder as '_batch_summary.txt'\n"
-            "  • Timestamped for reference\n\n"
-            "Useful for:\n"
-            "  • Tracking batch processing history\n"
-            "  • Verifying all files were processed\n"
-            "  • Identifying any issues during processing"
-        )
-        messagebox.showinfo("Summary Report Help", help_text, parent=self.frame)
-    
-    def show_preserve_structure_help(self):
-        """Show help dialog for preserve folder structure feature."""
-        help_text = (
-            "Preserve Folder Structure\n\n"
-            "Maintains the original directory hierarchy in the output folder.\n\n"
-            "When enabled:\n"
-            "  • Recreates input folder structure in output location\n"
-            "  • Example: input/2024/january/file.mp3\n"
-            "    → output/2024/january/file.txt\n\n"
-            "When disabled:\n"
-            "  • All transcripts are saved directly in output folder\n"
-            "  • Example: input/2024/january/file.mp3\n"
-            "    → output/file.txt\n\n"
-            "Use Case:\n"
-            "  • Enable when organizing files by date or category\n"
-            "  • Disable for a flat output structure\n\n"
-            "Note: Works best with 'Recursive' option enabled."
-        )
-        messagebox.showinfo("Folder Structure Help", help_text, parent=self.frame)
-    
-    def show_recursive_help(self):
-        """Show help dialog for recursive search feature."""
-        help_text = (
-            "Recursively Check for Audio Files\n\n"
-            "Controls whether to search subdirectories for audio files.\n\n"
-            "When enabled:\n"
-            "  • Searches input folder and all subdirectories\n"
-            "  • Finds audio files at any depth\n"
-            "  • Example: processes files in input/, input/2024/, input/2024/jan/, etc.\n\n"
-            "When disabled:\n"
-            "  • Only processes files directly in input folder\n"
-            "  • Ignores subdirectories\n"
-            "  • Example: only processes files in input/\n\n"
-            "Use Case:\n"
-            "  • Enable for organized hierarchical folders\n"
-            "  • Disable when all files are in one location\n\n"
-            "Tip: Combine with 'Preserve folder structure' to maintain organization."
-        )
-        messagebox.showinfo("Recursive Search Help", help_text, parent=self.frame)
-    
-    def show_timestamp_help(self):
-        """Show help dialog for timestamp feature."""
-        help_text = (
-            "Timestamp Options\n\n"
-            "Adds timestamps at regular intervals throughout transcripts.\n\n"
-            "Format Options:\n"
-            "  • HH:MM:SS - Standard format (e.g., [01:23:45])\n"
-            "  • MM:SS - Minutes and seconds only (e.g., [83:45])\n"
-            "  • timecode - Includes milliseconds (e.g., [01:23:45.678])\n\n"
-            "Interval Options:\n"
-            "  • 15, 30, 60, 120, 300, 600 seconds\n"
-            "  • Timestamps appear at the start of their own line\n"
-            "  • First timestamp is always at 00:00:00\n\n"
-            "Use timestamps to:\n"
-            "  • Navigate long transcripts easily\n"
-            "  • Reference specific parts of the audio\n"
-            "  • Create timestamped notes\n\n"
-            "Note: Timestamps are disabled by default."
-        )
-        messagebox.showinfo("Timestamp Help", help_text, parent=self.frame)
+    def _flush_save(self):
+        """Run the pending config save."""
+        self._save_after = None
+        self.app.save_config()
     
     def _on_timestamp_toggle(self):
         """Handle timestamp checkbox toggle."""
         state = "readonly" if self.timestamps_enabled.get() else "disabled"
         self.format_combo.config(state=state)
         self.interval_combo.config(state=state)
-        self.app.save_config()
+        self._debounced_save()
     
     def get_config(self):
         """Get tab configuration."""
+        input_mtime_ns = None
+        input_count = None
+        if self._audio_cache and self._audio_cache[0][:3] == (
+                self.input_folder, self.recursive.get(), self.follow_symlinks.get()):
+            input_mtime_ns = self._audio_cache[0][3]
+            input_count = self._audio_cache[2]
+        
         return {
             'input_folder': self.input_folder,
+            'input_mtime_ns': input_mtime_ns,
+            'input_count': input_count,
             'output_folder': self.output_folder,
             'detect_date': self.detect_date.get(),
             'chars_per_line': self.chars_per_line.get(),
@@ -543,6 +688,7 @@ class BatchTab:
             'create_summary': self.create_summary.get(),
             'preserve_structure': self.preserve_structure.get(),
             'recursive': self.recursive.get(),
+            'follow_symlinks': self.follow_symlinks.get(),
             'timestamps_enabled': self.timestamps_enabled.get(),
             'timestamp_format': self.timestamp_format.get(),
             'timestamp_interval': self.timestamp_interval.get()
@@ -572,6 +718,8 @@ class BatchTab:
             self.preserve_structure.set(config['preserve_structure'])
         if 'recursive' in config:
             self.recursive.set(config['recursive'])
+        if 'follow_symlinks' in config:
+            self.follow_symlinks.set(config['follow_symlinks'])
         if 'timestamps_enabled' in config:
             self.timestamps_enabled.set(config['timestamps_enabled'])
         if 'timestamp_format' in config:
@@ -579,6 +727,17 @@ class BatchTab:
         if 'timestamp_interval' in config:
             self.timestamp_interval.set(config['timestamp_interval'])
         
+        # Restore the saved file count so startup doesn't rescan an unchanged folder.
+        # The folder mtime misses changes in subfolders, so a recursive count is
+        # shown right away and recounted on a background thread.
+        if self.input_folder and config.get('input_mtime_ns') is not None \
+                and config.get('input_count') is not None:
+            key = self._input_cache_key()
+            if key and key[3] == config['input_mtime_ns']:
+                self._audio_cache = (key, None, config['input_count'])
+                if self.recursive.get():
+                    self._start_count()
+        
         # Update timestamp control states
         self._on_timestamp_toggle()
         self.check_ready()
@@ -1,11 +1,93 @@
 """Model configuration tab."""
 import tkinter as tk
-from tkinter import messagebox, scrolledtext, ttk
+from tkinter import messagebox, ttk
+import queue
 import threading
 from config.constants import MODEL_SPECS, MODEL_SIZES, COMPUTE_TYPES, ENGINES, STATUS_SUCCESS, STATUS_ERROR
 from config.environment import WHISPER_AVAILABLE, FASTER_WHISPER_AVAILABLE
 
 
+# Fixed pieces of the model info text
+_BAR_EQ = "=" * 63
+_BAR_DASH = "-" * 63
+
+_FOOTER = (
+    f"\n{_BAR_DASH}\n"
+    "DOWNLOAD INFORMATION:\n"
+    "Models are automatically downloaded on first use.\n"
+    "Cached location: ~/.cache/whisper/ (Linux/Mac)\n"
+    "                 C:\\Users\\[username]\\.cache\\whisper\\ (Windows)\n"
+)
+
+_PARAMS_TMPL = (
+    "Parameters:        {params}\n"
+    "VRAM Required:     {vram}\n"
+    "Speed:             {speed}\n"
+    "Accuracy:          {accuracy}\n"
+    "Best For:          {use_case}\n"
+    "Download Size:     {download}\n\n"
+)
+
+
+def _build_static_model_info(model_size):
+    """Build the parts of the model info text that depend only on the model size.
+    
+    Args:
+        model_size: Model size name.
+        
+    Returns:
+        Tuple of (header, specs_block) strings.
+    """
+    specs = MODEL_SPECS.get(model_size, MODEL_SPECS["base"])
+    header = f"{_BAR_EQ}\nMODEL: {model_size.upper()}\n{_BAR_EQ}\n\n"
+    return header, _PARAMS_TMPL.format_map(specs)
+
+
+# Capability bits required by each engine option
+_CAP_WHISPER = 1
+_CAP_FASTER = 2
+_CAP_GPU = 4
+
+# (label, engine value, required capabilities, description)
+_ENGINE_ROWS = (
+    ("Faster-Whisper GPU (Recommended for GPU users)", "faster_whisper_gpu",
+     _CAP_FASTER | _CAP_GPU, "2-4x faster than standard Whisper on GPU"),
+    ("Faster-Whisper CPU", "faster_whisper_cpu",
+     _CAP_FASTER, "Optimized for CPU, faster than standard Whisper"),
+    ("Whisper GPU", "whisper_gpu",
+     _CAP_WHISPER | _CAP_GPU, "Original OpenAI implementation with GPU support"),
+    ("Whisper CPU", "whisper_cpu",
+     _CAP_WHISPER, "Original implementation for CPU"),
+    ("Auto GPU (Automatically select best available)", "auto_gpu",
+     0, "Automatically chooses the best available GPU-accelerated engine"),
+)
+
+# Unavailability reason keyed by the missing capability bits
+_ENGINE_MISSING_REASONS = {
+    _CAP_WHISPER: "Library not installed",
+    _CAP_FASTER: "Library not installed",
+    _CAP_GPU: "GPU not available",
+    _CAP_WHISPER | _CAP_GPU: "GPU not available",
+    _CAP_FASTER | _CAP_GPU: "GPU not available",
+}
+
+# (label, compute type value, description)
+_COMPUTE_ROWS = (
+    ("float16 (Fastest, GPU only)", "float16",
+     "Uses 16-bit floating point. Fastest option, requires GPU. Recommended for most GPU users."),
+    ("int8 (Lower memory, slight quality loss)", "int8",
+     "8-bit integer quantization. Uses less memory, slight quality trade-off. Good for large models or limited VRAM."),
+    ("int8_float16 (Hybrid approach)", "int8_float16",
+     "Mixed precision: int8 weights with float16 computation. Balances memory and speed."),
+)
+
+# Compute types that need a GPU
+_GPU_ONLY_COMPUTE = frozenset(("float16", "int8_float16"))
+
+# Static model info text, built once per model size at import
+_MODEL_INFO_TEMPLATES = {size: _build_static_model_info(size) for size in MODEL_SIZES}
+
+
 class ModelConfigTab:
     """Model configuration tab UI."""
     
@@ -17,9 +99,28 @@ class ModelConfigTab:
         self.frame = ttk.Frame(parent_notebook, padding="10")
         parent_notebook.add(self.frame, text="Model Configuration")
         
+        # Inputs behind the text currently shown in the model info label
+        self._last_info_key = None
+        # Pending debounced config change (Tk after id)
+        self._pending_after = None
+        # GPU state is probed once; it does not change while the app runs
+        self._gpu_available = bool(self.app.environment.gpu_available)
+        self._gpu_info = self.app.environment.get_gpu_info() if self._gpu_available else None
+        
+        # Worker -> GUI messages, drained by a single poller on the Tk thread
+        self._ui_queue = queue.Queue()
+        # Download requests, served one at a time by a long-lived worker
+        self._dl_queue = queue.Queue()
+        self._dl_busy = False
+        self._dl_thread = threading.Thread(target=self._download_loop, daemon=True)
+        self._dl_thread.start()
+        
         self._create_ui()
         self.update_gpu_status()
-        self.update_model_info()
+        # Fill the info panel once the window is laid out; the download check
+        # touches the model caches and should not delay the first paint
+        self.frame.after_idle(self.update_model_info)
+        self._poll()
     
     def _create_ui(self):
         """Create UI components."""
@@ -100,45 +201,29 @@ class ModelConfigTab:
         
         ttk.Label(container, text="Select Engine:", font=("Arial", 10, "bold")).grid(row=0, column=0, sticky="w", pady=(0, 10))
         
-        engines = [
-            ("Faster-Whisper GPU (Recommended for GPU users)", "faster_whisper_gpu",
-             FASTER_WHISPER_AVAILABLE and self.app.environment.gpu_available,
-             "2-4x faster than standard Whisper on GPU"),
-            ("Faster-Whisper CPU", "faster_whisper_cpu",
-             FASTER_WHISPER_AVAILABLE,
-             "Optimized for CPU, faster than standard Whisper"),
-            ("Whisper GPU", "whisper_gpu",
-             WHISPER_AVAILABLE and self.app.environment.gpu_available,
-             "Original OpenAI implementation with GPU support"),
-            ("Whisper CPU", "whisper_cpu",
-             WHISPER_AVAILABLE,
-             "Original implementation for CPU"),
-            ("Auto GPU (Automatically select best available)", "auto_gpu",
-             True,
-             "Automatically chooses the best available GPU-accelerated engine"),
-        ]
-        
-        for i, (text, value, available, description) in enumerate(engines):
-            option_frame = ttk.Frame(container)
-            option_frame.grid(row=i+1, column=0, sticky="w", pady=2)
+        caps = (_CAP_WHISPER * WHISPER_AVAILABLE) | (_CAP_FASTER * FASTER_WHISPER_AVAILABLE) | (_CAP_GPU * self._gpu_available)
+        
+        for i, (text, value, required, description) in enumerate(_ENGINE_ROWS):
+            missing = required & ~caps
+            available = not missing
+            row = 1 + i * 3
             
             status = STATUS_SUCCESS if available else STATUS_ERROR
             rb_state = "normal" if available else "disabled"
             
-            rb = ttk.Radiobutton(option_frame, text=f"{status} {text}",
+            rb = ttk.Radiobutton(container, text=f"{status} {text}",
                                variable=self.app.engine, value=value,
                                command=self.on_config_change, state=rb_state)
-            rb.grid(row=0, column=0, sticky="w")
+            rb.grid(row=row, column=0, sticky="w", pady=(2, 0))
             
-            desc_label = ttk.Label(option_frame, text=f"    → {description}",
+            desc_label = ttk.Label(container, text=f"    → {description}",
                                   font=("Arial", 8),
                                   foreground="gray" if available else "lightgray")
-            desc_label.grid(row=1, column=0, sticky="w", padx=(20, 0))
+            desc_label.grid(row=row + 1, column=0, sticky="w", padx=(20, 0))
             
             if not available:
-                reason = "GPU not available" if "GPU" in text and not self.app.environment.gpu_available else "Library not installed"
-                ttk.Label(option_frame, text=f"    ⚠️ {reason}",
-                         font=("Arial", 8), foreground="red").grid(row=2, column=0, sticky="w", padx=(20, 0))
+                ttk.Label(container, text=f"    ⚠️ {_ENGINE_MISSING_REASONS[missing]}",
+                         font=("Arial", 8), foreground="red").grid(row=row + 2, column=0, sticky="w", padx=(20, 0))
     
     def _create_model_tab(self, parent):
         """Create model selection sub-tab."""
@@ -173,8 +258,16 @@ class ModelConfigTab:
         info_frame.columnconfigure(0, weight=1)
         info_frame.rowconfigure(0, weight=1)
         
-        self.model_info_text = scrolledtext.ScrolledText(info_frame, wrap=tk.WORD, font=("Consolas", 9))
+        # Read-only, selectable text, rewritten only when its content changes; the
+        # scrollbar is shown only when the text is taller than the panel
+        self.model_info_text = tk.Text(info_frame, wrap=tk.WORD, font=("Consolas", 9),
+                                       state="disabled")
         self.model_info_text.grid(row=0, column=0, sticky="nsew")
+        self._info_scrollbar = ttk.Scrollbar(info_frame, orient="vertical",
+                                             command=self.model_info_text.yview)
+        self._info_scrollbar.grid(row=0, column=1, sticky="ns")
+        self._info_scroll_shown = True
+        self.model_info_text.config(yscrollcommand=self._on_info_yview)
     
     def _create_compute_tab(self, parent):
         """Create compute precision sub-tab."""
@@ -187,110 +280,125 @@ class ModelConfigTab:
         
         ttk.Label(frame, text="Precision Type:", font=("Arial", 10, "bold")).grid(row=1, column=0, sticky="w", pady=(0, 10))
         
-        compute_types = [
-            ("float16 (Fastest, GPU only)", "float16",
-             "Uses 16-bit floating point. Fastest option, requires GPU. Recommended for most GPU users."),
-            ("int8 (Lower memory, slight quality loss)", "int8",
-             "8-bit integer quantization. Uses less memory, slight quality trade-off. Good for large models or limited VRAM."),
-            ("int8_float16 (Hybrid approach)", "int8_float16",
-             "Mixed precision: int8 weights with float16 computation. Balances memory and speed.")
-        ]
-        
-        for i, (text, value, description) in enumerate(compute_types):
-            option_frame = ttk.Frame(frame)
-            option_frame.grid(row=i+2, column=0, sticky="w", pady=5)
+        for i, (text, value, description) in enumerate(_COMPUTE_ROWS):
+            row = 2 + i * 3
             
-            available = True
-            if value in ["float16", "int8_float16"] and not self.app.environment.gpu_available:
-                available = False
+            available = self._gpu_available or value not in _GPU_ONLY_COMPUTE
             
             rb_state = "normal" if available else "disabled"
             
-            rb = ttk.Radiobutton(option_frame, text=text, variable=self.app.compute_type, value=value,
+            rb = ttk.Radiobutton(frame, text=text, variable=self.app.compute_type, value=value,
                                 command=self.on_config_change, state=rb_state)
-            rb.grid(row=0, column=0, sticky="w")
+            rb.grid(row=row, column=0, sticky="w", pady=(5, 0))
             
-            desc_label = ttk.Label(option_frame, text=f"    → {description}",
+            desc_label = ttk.Label(frame, text=f"    → {description}",
                                   font=("Arial", 8),
                                   foreground="gray" if available else "lightgray")
-            desc_label.grid(row=1, column=0, sticky="w", padx=(20, 0))
+            desc_label.grid(row=row + 1, column=0, sticky="w", padx=(20, 0))
             
             if not available:
-                ttk.Label(option_frame, text="    ⚠️ GPU required",
-                         font=("Arial", 8), foreground="red").grid(row=2, column=0, sticky="w", padx=(20, 0))
+                ttk.Label(frame, text="    ⚠️ GPU required",
+                         font=("Arial", 8), foreground="red").grid(row=row + 2, column=0, sticky="w", padx=(20, 0))
     
     def update_gpu_status(self):
         """Update GPU status."""
         self.gpu_label.config(text=self.app.environment.get_gpu_status_text())
     
+    def _render_model_info(self, text):
+        """Replace the contents of the read-only model info text widget.
+        
+        Args:
+            text: New model info text.
+        """
+        self.model_info_text.config(state="normal")
+        self.model_info_text.delete("1.0", tk.END)
+        self.model_info_text.insert("1.0", text)
+        self.model_info_text.config(state="disabled")
+    
+    def _on_info_yview(self, first, last):
+        """Update the model info scrollbar, hiding it while all text is visible."""
+        needed = float(first) > 0.0 or float(last) < 1.0
+        # Re-grid only when visibility flips, not on every scroll report
+        if needed != self._info_scroll_shown:
+            self._info_scroll_shown = needed
+            if needed:
+                self._info_scrollbar.grid()
+            else:
+                self._info_scrollbar.grid_remove()
+        self._info_scrollbar.set(first, last)
+    
     def update_model_info(self):
         """Update model information display."""
         model_size = self.app.model_size.get()
-        specs = MODEL_SPECS.get(model_size, MODEL_SPECS["base"])
+        header, specs_block = _MODEL_INFO_TEMPLATES.get(model_size) or _build_static_model_info(model_size)
         
         whisper_dl, faster_whisper_dl = self.app.model_manager.check_model_downloaded(model_size)
         
-        info_text = f"{'='*63}\n"
-        info_text += f"MODEL: {model_size.upper()}\n"
-        info_text += f"{'='*63}\n\n"
+        # Nothing that feeds the text has changed
+        key = (model_size, whisper_dl, faster_whisper_dl, self._gpu_available)
+        if key == self._last_info_key:
+            return
         
-        info_text += "Download Status:\n"
+        parts = [header, "Download Status:\n"]
         if WHISPER_AVAILABLE:
             status = f"{STATUS_SUCCESS} Downloaded" if whisper_dl else f"{STATUS_ERROR} Not Downloaded"
-            info_text += f"  • Whisper:        {status}\n"
+            parts.append(f"  • Whisper:        {status}\n")
         if FASTER_WHISPER_AVAILABLE:
             status = f"{STATUS_SUCCESS} Downloaded" if faster_whisper_dl else f"{STATUS_ERROR} Not Downloaded"
-            info_text += f"  • Faster-Whisper: {status}\n"
+            parts.append(f"  • Faster-Whisper: {status}\n")
         
         if not whisper_dl and not faster_whisper_dl:
-            info_text += "  💡 Will download automatically on first use\n"
-        info_text += "\n"
-        
-        info_text += f"Parameters:        {specs['params']}\n"
-        info_text += f"VRAM Required:     {specs['vram']}\n"
-        info_text += f"Speed:             {specs['speed']}\n"
-        info_text += f"Accuracy:          {specs['accuracy']}\n"
-        info_text += f"Best For:          {specs['use_case']}\n"
-        info_text += f"Download Size:     {specs['download']}\n\n"
-        
-        if self.app.environment.gpu_available:
-            gpu_info = self.app.environment.get_gpu_info()
-            info_text += f"Your GPU VRAM:     {gpu_info['memory_gb']:.1f}GB\n"
+            parts.append("  💡 Will download automatically on first use\n")
+        parts.append("\n")
+        
+        parts.append(specs_block)
+        
+        if self._gpu_available:
+            gpu_info = self._gpu_info
+            parts.append(f"Your GPU VRAM:     {gpu_info['memory_gb']:.1f}GB\n")
             
             if model_size == "base":
-                info_text += f"\n{STATUS_SUCCESS} RECOMMENDED: Base model offers excellent balance of speed and accuracy.\n"
+                parts.append(f"\n{STATUS_SUCCESS} RECOMMENDED: Base model offers excellent balance of speed and accuracy.\n")
             elif model_size == "tiny":
-                info_text += "\n⚡ FASTEST: Great for quick drafts or testing.\n"
+                parts.append("\n⚡ FASTEST: Great for quick drafts or testing.\n")
             elif model_size in ["large-v3", "turbo"] and gpu_info['memory_gb'] < 8:
-                info_text += "\n⚠️  WARNING: This model may exceed your GPU memory.\n"
+                parts.append("\n⚠️  WARNING: This model may exceed your GPU memory.\n")
         else:
-            info_text += f"\n{STATUS_ERROR} No GPU detected - CPU processing will be slower\n"
-            info_text += "💡 Consider 'tiny' or 'base' models for CPU usage\n"
+            parts.append(f"\n{STATUS_ERROR} No GPU detected - CPU processing will be slower\n")
+            parts.append("💡 Consider 'tiny' or 'base' models for CPU usage\n")
         
-        info_text += f"\n{'-'*63}\n"
-        info_text += "DOWNLOAD INFORMATION:\n"
-        info_text += "Models are automatically downloaded on first use.\n"
-        info_text += "Cached location: ~/.cache/whisper/ (Linux/Mac)\n"
-        info_text += "                 C:\\Users\\[username]\\.cache\\whisper\\ (Windows)\n"
+        parts.append(_FOOTER)
         
-        self.model_info_text.config(state="normal")
-        self.model_info_text.delete("1.0", tk.END)
-        self.model_info_text.insert("1.0", info_text)
-        self.model_info_text.config(state="disabled")
+        self._render_model_info("".join(parts))
+        self._last_info_key = key
     
     def on_config_change(self):
-        """Handle configuration change."""
+        """Handle configuration change, coalescing rapid clicks into one update."""
+        if self._pending_after:
+            self.frame.after_cancel(self._pending_after)
+        self._pending_after = self.frame.after(150, self._apply_config_change)
+    
+    def _apply_config_change(self):
+        """Refresh model info and save configuration after changes settle."""
+        self._pending_after = None
         self.update_model_info()
         self.app.save_config()
     
     def download_selected(self):
         """Download selected model."""
+        if self._dl_busy:
+            return
+        
         model_size = self.app.model_size.get()
-        self.download_status_label.config(text=f"Downloading {model_size} model...", foreground="blue")
-        threading.Thread(target=self._download_worker, args=(model_size,), daemon=True).start()
+        self._set_status(f"Downloading {model_size} model...", "blue")
+        self._dl_busy = True
+        self._dl_queue.put(("one", model_size))
     
     def download_all(self):
         """Download all models."""
+        if self._dl_busy:
+            return
+        
         if not messagebox.askyesno("Download All Models",
                                    "This will download all 6 model sizes (tiny, base, small, medium, large-v3, turbo).\n"
                                    "Total download size: ~7GB\n\n"
@@ -298,8 +406,49 @@ class ModelConfigTab:
                                    "Continue?"):
             return
         
-        self.download_status_label.config(text="Downloading all models...", foreground="blue")
-        threading.Thread(target=self._download_all_worker, daemon=True).start()
+        self._set_status("Downloading all models...", "blue")
+        self._dl_busy = True
+        self._dl_queue.put(("all", None))
+    
+    def _download_loop(self):
+        """Serve queued download requests on the persistent download thread."""
+        while True:
+            kind, model_size = self._dl_queue.get()
+            try:
+                if kind == "all":
+                    self._download_all_worker()
+                else:
+                    self._download_worker(model_size)
+            finally:
+                self._dl_busy = False
+    
+    def _set_status(self, text, color):
+        """Show a download status message."""
+        self.download_status_label.config(text=text, foreground=color)
+    
+    def _clear_status(self):
+        """Clear the download status message."""
+        self.download_status_label.config(text="")
+    
+    def _poll(self):
+        """Apply queued worker messages on the Tk thread, then reschedule."""
+        while True:
+            try:
+                kind, *args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if kind == "status":
+                self._set_status(*args)
+            elif kind == "clear":
+                self.frame.after(args[0], self._clear_status)
+            elif kind == "msgbox":
+                show, title, body = args
+                show(title, body)
+            elif kind == "refresh":
+                self.update_model_info()
+        
+        self.frame.after(50, self._poll)
     
     def _download_worker(self, model_size):
         """Download model worker."""
@@ -309,44 +458,36 @@ class ModelConfigTab:
                 self.app.engine.get(),
                 self.app.compute_type.get()
             )
-            self.app.root.after(0, lambda: self.download_status_label.config(
-                text=f"{STATUS_SUCCESS} {model_size} model downloaded successfully!", foreground="green"))
-            self.app.root.after(3000, lambda: self.download_status_label.config(text=""))
-            self.app.root.after(0, self.update_model_info)
+            self._ui_queue.put(("status", f"{STATUS_SUCCESS} {model_size} model downloaded successfully!", "green"))
+            self._ui_queue.put(("clear", 3000))
+            self._ui_queue.put(("refresh",))
         except Exception as e:
-            self.app.root.after(0, lambda: self.download_status_label.config(
-                text=f"{STATUS_ERROR} Download failed: {str(e)}", foreground="red"))
-            self.app.root.after(0, lambda e=e: messagebox.showerror("Download Error", f"Failed to download model: {e}"))
+            self._ui_queue.put(("status", f"{STATUS_ERROR} Download failed: {str(e)}", "red"))
+            self._ui_queue.put(("msgbox", messagebox.showerror, "Download Error", f"Failed to download model: {e}"))
     
     def _download_all_worker(self):
         """Download all models worker."""
         failed_models = []
+        engine = self.app.engine.get()
+        compute_type = self.app.compute_type.get()
         
+        # One at a time: downloading builds the full model, on the GPU when present,
+        # so parallel downloads could hold several large models in memory at once
         for i, model_size in enumerate(MODEL_SIZES):
+            self._ui_queue.put(("status", f"Downloading {model_size} ({i+1}/{len(MODEL_SIZES)})...", "blue"))
             try:
-                self.app.root.after(0, lambda i=i, m=model_size: self.download_status_label.config(
-                    text=f"Downloading {m} ({i+1}/{len(MODEL_SIZES)})...", foreground="blue"))
-                
-                self.app.model_manager.download_model(
-                    model_size,
-                    self.app.engine.get(),
-                    self.app.compute_type.get()
-                )
+                self.app.model_manager.download_model(model_size, engine, compute_type)
             except Exception as e:
                 failed_models.append(f"{model_size}: {str(e)}")
         
         if len(failed_models) == 0:
-            self.app.root.after(0, lambda: self.download_status_label.config(
-                text=f"{STATUS_SUCCESS} All {len(MODEL_SIZES)} models downloaded successfully!", foreground="green"))
-            self.app.root.after(0, lambda: messagebox.showinfo(
-                "Download Complete",
-                f"Successfully downloaded all {len(MODEL_SIZES)} models!"))
+            self._ui_queue.put(("status", f"{STATUS_SUCCESS} All {len(MODEL_SIZES)} models downloaded successfully!", "green"))
+            self._ui_queue.put(("msgbox", messagebox.showinfo, "Download Complete",
+                                f"Successfully downloaded all {len(MODEL_SIZES)} models!"))
         else:
-            self.app.root.after(0, lambda: self.download_status_label.config(
-                text=f"⚠️ Completed with {len(failed_models)} errors", foreground="orange"))
+            self._ui_queue.put(("status", f"⚠️ Completed with {len(failed_models)} errors", "orange"))
             error_msg = "Failed models:\n" + "\n".join(failed_models)
-            self.app.root.after(0, lambda: messagebox.showwarning(
-                "Download Completed with Errors", error_msg))
+            self._ui_queue.put(("msgbox", messagebox.showwarning, "Download Completed with Errors", error_msg))
         
-        self.app.root.after(5000, lambda: self.download_status_label.config(text=""))
-        self.app.root.after(0, self.update_model_info)
+        self._ui_queue.put(("clear", 5000))
+        self._ui_queue.put(("refresh",))
@@ -1,7 +1,9 @@
 """Single file transcription tab."""
 import tkinter as tk
-from tkinter import filedialog, messagebox, scrolledtext, ttk
+from tkinter import filedialog, messagebox, ttk
 import os
+import shutil
+import tempfile
 import time
 import threading
 from utilities.format_utils import FormatUtils
@@ -9,6 +11,29 @@ from utilities.date_parser import DateParser
 from utilities.audio_utils import AudioUtils
 from config.constants import TIMESTAMP_FORMATS, TIMESTAMP_INTERVALS, DEFAULT_TIMESTAMP_FORMAT, DEFAULT_TIMESTAMP_INTERVAL
 
+# Transcript header; the *_block and *_line fields are whole lines or empty strings
+_HEADER_TEMPLATE = (
+    "Transcript of: {base}\n"
+    "{date_info}"
+    "Transcribed: {now}\n"
+    "\n--- TRANSCRIPTION METADATA ---\n"
+    "File Size:         {file_size:.2f} MB\n"
+    "{audio_block}"
+    "{duration_block}"
+    "Processing Time:   {processing_time}\n"
+    "{speed_block}"
+    "Engine:            {engine}\n"
+    "Model:             {model}\n"
+    "Compute Precision: {compute_type}\n"
+    "{device_line}"
+    "Language:          {language}\n"
+    "{confidence_block}"
+    + "=" * 60 + "\n\n"
+)
+
+# Transcript lines kept in the result widget at once; the rest are swapped in on scroll
+_VIEW_LINES = 400
+
 
 class SingleFileTab:
     """Single file transcription tab UI."""
@@ -29,9 +54,33 @@ class SingleFileTab:
         
         # State variables
         self.file_path = None
+        # Derived from file_path by _set_file_path; the size is filled in by a probe
+        self._file_base = None
+        self._file_stem = None
+        self._cached_file_size_mb = None
         self.processing = False
         self.cancel_requested = False
-        self.current_transcript = None
+        # Finished transcript is kept on disk, not as a second in-memory copy; the
+        # lock hands the file over from the worker without racing window close
+        self._transcript_tmp = None
+        self._transcript_lock = threading.Lock()
+        # Windowed result view: all lines, first rendered line, pending re-window
+        self._lines = []
+        self._view_top = 0
+        self._recenter_after = None
+        self._last_status = None
+        # Newest status posted by the worker, applied by the _tick poller
+        self._pending_status = None
+        self._tick_after = None
+        self._save_after = None
+        # Help dialogs built on first open, then hidden and reshown
+        self._help_windows = {}
+        
+        # Device line for transcript headers; the GPU does not change while the app runs
+        if self.app.environment.gpu_available:
+            self._device_line = f"GPU:               {self.app.environment.get_gpu_info()['name']}\n"
+        else:
+            self._device_line = "Device:            CPU\n"
         
         # Configuration variables
         self.detect_date = tk.BooleanVar(value=True)
@@ -82,7 +131,7 @@ class SingleFileTab:
         
         ttk.Checkbutton(date_frame, text="Detect recording date from filename",
                        variable=self.detect_date,
-                       command=self.app.save_config).grid(row=0, column=0, sticky="w")
+                       command=self._debounced_save).grid(row=0, column=0, sticky="w")
         
         help_btn = ttk.Button(date_frame, text="?", width=3, command=self.show_date_detection_help)
         help_btn.grid(row=0, column=1, padx=(5, 0))
@@ -93,10 +142,9 @@ class SingleFileTab:
         
         ttk.Label(format_frame, text="Characters per line:").grid(row=0, column=0, sticky="w")
         words_spin = ttk.Spinbox(format_frame, from_=0, to=200, width=8, 
-                                textvariable=self.chars_per_line,
-                                command=self.app.save_config)
+                                textvariable=self.chars_per_line)
         words_spin.grid(row=0, column=1, padx=(5, 5))
-        self.chars_per_line.trace_add('write', lambda *args: self.app.save_config())
+        self.chars_per_line.trace_add('write', lambda *args: self._debounced_save())
         ttk.Label(format_frame, text="(0 = no breaks)", foreground="gray", 
                  font=("Arial", 8)).grid(row=0, column=2, sticky="w")
         ttk.Button(format_frame, text="?", width=3, command=self.show_chars_per_line_help).grid(
@@ -123,7 +171,7 @@ class SingleFileTab:
             width=12
         )
         self.format_combo.grid(row=0, column=2, sticky="w")
-        self.format_combo.bind('<<ComboboxSelected>>', lambda e: self.app.save_config())
+        self.format_combo.bind('<<ComboboxSelected>>', lambda e: self._debounced_save())
         
         ttk.Label(timestamp_frame, text="Interval:").grid(row=0, column=3, sticky="w", padx=(20, 5))
         self.interval_combo = ttk.Combobox(
@@ -134,7 +182,7 @@ class SingleFileTab:
             width=8
         )
         self.interval_combo.grid(row=0, column=4, sticky="w")
-        self.interval_combo.bind('<<ComboboxSelected>>', lambda e: self.app.save_config())
+        self.interval_combo.bind('<<ComboboxSelected>>', lambda e: self._debounced_save())
         
         ttk.Label(timestamp_frame, text="seconds", foreground="gray", font=("Arial", 8)).grid(
             row=0, column=5, sticky="w", padx=(5, 0))
@@ -170,15 +218,30 @@ class SingleFileTab:
         results_frame.columnconfigure(0, weight=1)
         results_frame.rowconfigure(0, weight=1)
         
-        self.text_area = scrolledtext.ScrolledText(results_frame, wrap=tk.WORD,
-                                                   font=("Consolas", 10))
-        self.text_area.grid(row=0, column=0, sticky="nsew")
+        view_frame = ttk.Frame(results_frame)
+        view_frame.grid(row=0, column=0, sticky="nsew")
+        view_frame.columnconfigure(0, weight=1)
+        view_frame.rowconfigure(0, weight=1)
         
-        # Save button below transcription area
-        self.save_btn = ttk.Button(results_frame, text="Save Transcript To File",
+        self.text_area = tk.Text(view_frame, wrap=tk.WORD, font=("Consolas", 10),
+                                 undo=False, maxundo=0, autoseparators=False,
+                                 state="disabled", yscrollcommand=self._on_text_yview)
+        self.text_area.grid(row=0, column=0, sticky="nsew")
+        self.text_scroll = ttk.Scrollbar(view_frame, orient="vertical", command=self._on_scrollbar)
+        self.text_scroll.grid(row=0, column=1, sticky="ns")
+        
+        # Save and copy buttons below transcription area; the text widget only holds
+        # a window of a long transcript, so Copy All reads the whole stored transcript
+        result_btn_frame = ttk.Frame(results_frame)
+        result_btn_frame.grid(row=1, column=0, pady=(10, 0))
+        self.save_btn = ttk.Button(result_btn_frame, text="Save Transcript To File",
                                    command=self.save_transcript,
                                    state="disabled")
-        self.save_btn.grid(row=1, column=0, pady=(10, 0))
+        self.save_btn.grid(row=0, column=0)
+        self.copy_btn = ttk.Button(result_btn_frame, text="Copy All",
+                                   command=self.copy_transcript,
+                                   state="disabled")
+        self.copy_btn.grid(row=0, column=1, padx=(10, 0))
         
         # Status bar
         self.status = tk.StringVar(value="Ready - Select an audio file to begin")
@@ -196,14 +259,51 @@ class SingleFileTab:
         filename = filedialog.askopenfilename(title="Select Audio File", filetypes=file_types)
         
         if filename:
-            self.file_path = filename
+            self._set_file_path(filename)
             self.file_label.config(text=filename, foreground="black")
             self.transcribe_btn.config(state="normal")
+            self.status.set(f"Selected: {self._file_base}")
             
+            # Stat off the Tk thread; slow on network and cloud-mounted drives
+            threading.Thread(target=self._probe_file, args=(filename,), daemon=True).start()
+    
+    def _set_file_path(self, path, file_size_mb=None):
+        """Select an audio file and cache the names derived from its path.
+        
+        Args:
+            path: Path of the audio file.
+            file_size_mb: Size in MB if already known, otherwise None.
+        """
+        self.file_path = path
+        self._file_base = os.path.basename(path)
+        self._file_stem = os.path.splitext(self._file_base)[0]
+        self._cached_file_size_mb = file_size_mb
+    
+    def _probe_file(self, filename):
+        """Read the selected file's size and report it on the Tk thread.
+        
+        Args:
+            filename: Path of the selected audio file.
+        """
+        try:
             file_size = os.path.getsize(filename) / (1024 * 1024)
-            self.status.set(f"Selected: {os.path.basename(filename)} ({file_size:.1f} MB)")
-            
-            self.app.save_config()
+        except OSError:
+            file_size = None
+        self.app.call_in_ui(self._on_file_probed, filename, file_size)
+    
+    def _on_file_probed(self, filename, file_size):
+        """Show the probed file size and persist the selection.
+        
+        Args:
+            filename: Path of the probed file.
+            file_size: Size in MB, or None if it could not be read.
+        """
+        if filename != self.file_path:
+            return
+        self._cached_file_size_mb = file_size
+        if file_size is not None:
+            self.status.set(f"Selected: {self._file_base} ({file_size:.1f} MB)")
+        self._debounced_save()
     
     def transcribe_file(self):
         """Start transcription."""
@@ -212,20 +312,30 @@ class SingleFileTab:
             return
         
         self.cancel_requested = False
+        self.processing = True
+        self._last_status = None
+        self._pending_status = None
         self.transcribe_btn.config(state="disabled")
         self.cancel_btn.config(state="normal")
         self.progress.start()
-        self.text_area.delete("1.0", tk.END)
+        self._show_transcript("")
         
         # Freeze other tabs
         self.app.freeze_other_tabs(0)
+        self.app.cancel_model_unload()
         
-        threading.Thread(target=self._transcribe_worker, daemon=True).start()
+        if not self._tick_after:
+            self._tick()
+        self.app.submit_job(self._transcribe_worker)
     
     def _transcribe_worker(self):
         """Worker thread for transcription."""
+        # Set only once the transcript is complete and stored
+        transcript = None
         try:
-            file_size = os.path.getsize(self.file_path) / (1024 * 1024)
+            file_size = self._cached_file_size_mb
+            if file_size is None:
+                file_size = os.path.getsize(self.file_path) / (1024 * 1024)
             
             self.update_status("Loading model...")
             self.app.model_manager.load_model(
@@ -271,71 +381,188 @@ class SingleFileTab:
                 self.update_status("Transcription cancelled")
                 return
             
-            # Format text if requested
-            if self.chars_per_line.get() > 0:
-                text = FormatUtils.format_text_with_line_breaks(text, self.chars_per_line.get())
+            # Format text if requested and some line is actually too long
+            width = self.chars_per_line.get()
+            if width > 0 and any(len(line) > width for line in text.split('\n')):
+                text = FormatUtils.format_text_with_line_breaks(text, width)
+            
+            if self.cancel_requested:
+                self.update_status("Transcription cancelled")
+                return
+            
+            base_name = self._file_base
             
             # Detect date if requested
             date_info = ""
             if self.detect_date.get():
-                detected_date, day_of_week = DateParser.detect_date_from_filename(
-                    os.path.basename(self.file_path)
-                )
+                detected_date, day_of_week = DateParser.detect_date_from_filename(base_name)
                 if detected_date:
-                    date_info = f"Recording Date: {detected_date.strftime('%Y-%m-%d')} ({day_of_week})\n"
-            
-            # Prepare final text
-            final_text = f"Transcript of: {os.path.basename(self.file_path)}\n"
-            final_text += date_info
-            final_text += f"Transcribed: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
-            final_text += "\n--- TRANSCRIPTION METADATA ---\n"
-            final_text += f"File Size:         {file_size:.2f} MB\n"
-            
-            audio_info = AudioUtils.format_audio_info(audio_metadata)
-            if audio_info != "Unknown":
-                final_text += f"Audio Format:      {audio_info}\n"
+                    date_info = f"Recording Date: {detected_date.date().isoformat()} ({day_of_week})\n"
             
-            mp3_tags = AudioUtils.format_mp3_tags(audio_metadata)
-            if mp3_tags:
-                final_text += f"MP3 Tags:\n{mp3_tags}\n"
+            # Prepare final text; optional lines are empty strings when not applicable
+            audio_block = ""
+            if audio_metadata:
+                info = AudioUtils.build(audio_metadata)
+                if info.summary:
+                    audio_block += f"Audio Format:      {info.summary}\n"
+                if info.mp3_tags:
+                    audio_block += f"MP3 Tags:\n{info.mp3_tags}\n"
             
+            duration_block = ""
+            speed_block = ""
             if duration > 0:
-                final_text += f"Duration:          {FormatUtils.format_time(duration)}\n"
-            final_text += f"Processing Time:   {FormatUtils.format_time(processing_time)}\n"
-            if duration > 0 and processing_time > 0:
-                speed_ratio = duration / processing_time
-                final_text += f"Speed:             {speed_ratio:.1f}x real-time\n"
-            final_text += f"Engine:            {self.app.engine.get()}\n"
-            final_text += f"Model:             {self.app.model_size.get()}\n"
-            final_text += f"Compute Precision: {self.app.compute_type.get()}\n"
-            if self.app.environment.gpu_available:
-                gpu_name = self.app.environment.get_gpu_info()['name']
-                final_text += f"GPU:               {gpu_name}\n"
-            else:
-                final_text += f"Device:            CPU\n"
-            final_text += f"Language:          {language}\n"
+                duration_block = f"Duration:          {FormatUtils.format_time(duration)}\n"
+                if processing_time > 0:
+                    speed_block = f"Speed:             {duration / processing_time:.1f}x real-time\n"
+            
+            confidence_block = ""
             if avg_confidence is not None:
-                confidence_pct = (1 + avg_confidence) * 100
-                final_text += f"Confidence:        {confidence_pct:.1f}%\n"
-            final_text += "=" * 60 + "\n\n"
-            final_text += text
+                confidence_block = f"Confidence:        {(1 + avg_confidence) * 100:.1f}%\n"
+            
+            final_text = _HEADER_TEMPLATE.format_map({
+                'base': base_name,
+                'date_info': date_info,
+                'now': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'file_size': file_size,
+                'audio_block': audio_block,
+                'duration_block': duration_block,
+                'processing_time': FormatUtils.format_time(processing_time),
+                'speed_block': speed_block,
+                'engine': self.app.engine.get(),
+                'model': self.app.model_size.get(),
+                'compute_type': self.app.compute_type.get(),
+                'device_line': self._device_line,
+                'language': language,
+                'confidence_block': confidence_block,
+            }) + text
+            
+            if self.cancel_requested:
+                self.update_status("Transcription cancelled")
+                return
+            
+            if self.app.closing:
+                return
             
             # Store transcript and display in text area
-            self.current_transcript = final_text
-            self.app.root.after(0, lambda: self.text_area.insert("1.0", final_text))
-            self.app.root.after(0, lambda: self.save_btn.config(state="normal"))
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.txt', delete=False) as tmp:
+                tmp.write(final_text)
+            with self._transcript_lock:
+                if self.app.closing:
+                    # The window closed while writing; nothing will save or delete it
+                    os.remove(tmp.name)
+                    return
+                self._discard_transcript_locked()
+                self._transcript_tmp = tmp.name
+            transcript = final_text
             
             self.update_status("Transcription complete - Use 'Save Transcript To File' to save")
             
         except Exception as e:
-            self.app.root.after(0, lambda e=e: messagebox.showerror("Error", f"Transcription failed: {e}"))
+            self.app.call_in_ui(self._show_error_async, f"Transcription failed: {e}")
             self.update_status("Transcription failed")
         finally:
-            self.app.model_manager.cleanup_model()
-            self.app.root.after(0, self.progress.stop)
-            self.app.root.after(0, lambda: self.transcribe_btn.config(state="normal"))
-            self.app.root.after(0, lambda: self.cancel_btn.config(state="disabled"))
-            self.app.root.after(0, self.app.unfreeze_all_tabs)
+            self.app.call_in_ui(self._finalize_ui, transcript)
+    
+    def _finalize_ui(self, transcript=None):
+        """Show the result, if any, and restore controls after a transcription ends.
+        
+        Args:
+            transcript: Finished transcript, or None if it failed or was cancelled.
+        """
+        self.processing = False
+        if transcript is not None:
+            self._show_transcript(transcript)
+            self.save_btn.config(state="normal")
+            self.copy_btn.config(state="normal")
+        self.progress.stop()
+        self.transcribe_btn.config(state="normal")
+        self.cancel_btn.config(state="disabled")
+        self.app.unfreeze_all_tabs()
+        # Free the model off the Tk thread, after the controls are back
+        self.app.submit_job(self.app.model_manager.cleanup_model)
+    
+    def _show_transcript(self, text):
+        """Display a transcript in the windowed result view.
+        
+        Args:
+            text: Full transcript text.
+        """
+        self._lines = text.splitlines()
+        self._render_window(0, 0)
+    
+    def _render_window(self, top, focus_line):
+        """Load a slice of the transcript into the text widget.
+        
+        Args:
+            top: Index of the first transcript line to render.
+            focus_line: Transcript line to scroll to the top of the widget.
+        """
+        if self._recenter_after:
+            self.app.root.after_cancel(self._recenter_after)
+            self._recenter_after = None
+        
+        top = max(0, min(top, len(self._lines) - _VIEW_LINES))
+        self._view_top = top
+        
+        # Detach the scrollbar while the slice is swapped so it only updates once
+        self.text_area.config(state="normal", yscrollcommand="")
+        self.text_area.delete("1.0", tk.END)
+        self.text_area.insert("1.0", "\n".join(self._lines[top:top + _VIEW_LINES]))
+        self.text_area.config(state="disabled", yscrollcommand=self._on_text_yview)
+        self.text_area.yview(f"{focus_line - top + 1}.0")
+    
+    def _on_scrollbar(self, *args):
+        """Map scrollbar drags onto the whole transcript rather than the rendered slice."""
+        total = len(self._lines)
+        if args[0] == "moveto" and total > _VIEW_LINES:
+            line = min(int(float(args[1]) * total), total - 1)
+            self._render_window(line - _VIEW_LINES // 2, line)
+        else:
+            self.text_area.yview(*args)
+    
+    def _on_text_yview(self, first, last):
+        """Report the rendered slice's position as a fraction of the whole transcript.
+        
+        Also schedules a re-window when scrolling nears either edge of the slice.
+        """
+        first, last = float(first), float(last)
+        total = len(self._lines)
+        if total <= _VIEW_LINES:
+            self.text_scroll.set(first, last)
+            return
+        
+        top = self._view_top
+        rendered = min(_VIEW_LINES, total - top)
+        self.text_scroll.set((top + first * rendered) / total, (top + last * rendered) / total)
+        
+        near_start = first < 0.1 and top > 0
+        near_end = last > 0.9 and top + rendered < total
+        if (near_start or near_end) and not self._recenter_after:
+            self._recenter_after = self.app.root.after_idle(self._recenter)
+    
+    def _recenter(self):
+        """Re-window the transcript around the line currently at the top of the view."""
+        self._recenter_after = None
+        rendered = min(_VIEW_LINES, len(self._lines) - self._view_top)
+        line = self._view_top + int(self.text_area.yview()[0] * rendered)
+        self._render_window(line - _VIEW_LINES // 2, line)
+    
+    def _show_error_async(self, message):
+        """Show an error in a non-modal window so the rest of the UI stays usable.
+        
+        Args:
+            message: Error message to display.
+        """
+        win = tk.Toplevel(self.frame)
+        win.title("Error")
+        win.transient(self.frame.winfo_toplevel())
+        win.resizable(False, False)
+        
+        body = ttk.Frame(win, padding="15")
+        body.grid(row=0, column=0, sticky="nsew")
+        ttk.Label(body, text=message, foreground="red", wraplength=400,
+                 justify="left").grid(row=0, column=0, sticky="w")
+        ttk.Button(body, text="OK", command=win.destroy).grid(row=1, column=0, pady=(15, 0))
     
     def cancel_processing(self):
         """Cancel processing."""
@@ -344,14 +571,14 @@ class SingleFileTab:
     
     def save_transcript(self):
         """Save transcript to file."""
-        if not self.current_transcript:
+        if not self._transcript_tmp:
             messagebox.showwarning("No Transcript", "No transcript available to save.")
             return
         
         # Suggest filename based on source audio file
         default_name = "transcript.txt"
         if self.file_path:
-            default_name = os.path.splitext(os.path.basename(self.file_path))[0] + '.txt'
+            default_name = self._file_stem + '.txt'
         
         filename = filedialog.asksaveasfilename(
             title="Save Transcript As",
@@ -362,22 +589,81 @@ class SingleFileTab:
         
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.current_transcript)
+                shutil.copyfile(self._transcript_tmp, filename)
                 self.status.set(f"Transcript saved to {os.path.basename(filename)}")
                 messagebox.showinfo("Success", f"Transcript saved to:\n{filename}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save transcript:\n{e}")
     
+    def copy_transcript(self):
+        """Copy the whole transcript, not just the rendered window, to the clipboard."""
+        with self._transcript_lock:
+            tmp_path = self._transcript_tmp
+        try:
+            with open(tmp_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except (OSError, TypeError):
+            text = "\n".join(self._lines)
+        if not text:
+            return
+        self.frame.clipboard_clear()
+        self.frame.clipboard_append(text)
+        self.status.set("Transcript copied to clipboard")
+    
+    def discard_transcript(self):
+        """Delete the temporary file holding the last transcript, if any."""
+        with self._transcript_lock:
+            self._discard_transcript_locked()
+    
+    def _discard_transcript_locked(self):
+        """Delete the transcript temp file; the caller holds _transcript_lock."""
+        if self._transcript_tmp:
+            try:
+                os.remove(self._transcript_tmp)
+            except OSError:
+                pass
+            self._transcript_tmp = None
+    
     def update_status(self, message):
-        """Update status message."""
-        self.app.root.after(0, lambda: self.status.set(message))
+        """Post a status message for the next _tick, skipping repeats of the last one posted."""
+        if message == self._last_status:
+            return
+        self._last_status = message
+        # Single attribute store; a burst of messages collapses to the newest
+        self._pending_status = message
+    
+    def _tick(self):
+        """Apply the newest pending status and reschedule while a transcription runs.
+        
+        Polls every 30ms right after a change and backs off to 100ms when idle;
+        stops once processing has ended and the last status is shown.
+        """
+        message = self._pending_status
+        if message is not None:
+            self._pending_status = None
+            self.status.set(message)
+        if self.processing:
+            delay = 30 if message is not None else 100
+            self._tick_after = self.app.root.after(delay, self._tick)
+        else:
+            self._tick_after = None
     
     def _on_timestamp_toggle(self):
         """Handle timestamp checkbox toggle."""
         state = "readonly" if self.timestamps_enabled.get() else "disabled"
         self.format_combo.config(state=state)
         self.interval_combo.config(state=state)
+        self._debounced_save()
+    
+    def _debounced_save(self):
+        """Schedule a config save, coalescing bursts of UI changes into one write."""
+        if self._save_after:
+            self.frame.after_cancel(self._save_after)
+        self._save_after = self.frame.after(500, self._flush_save)
+    
+    def _flush_save(self):
+        """Run the pending config save."""
+        self._save_after = None
         self.app.save_config()
     
     def show_date_detection_help(self):
@@ -395,7 +681,7 @@ class SingleFileTab:
             "  • Format: YYYY-MM-DD (DayOfWeek)\n\n"
             "If no date is found, the transcript is created without date information."
         )
-        messagebox.showinfo("Date Detection Help", help_text, parent=self.frame)
+        self._show_help("Date Detection Help", help_text)
     
     def show_chars_per_line_help(self):
         """Show help dialog for characters per line feature."""
@@ -412,7 +698,7 @@ class SingleFileTab:
             "  • Higher values: Longer lines before wrapping\n\n"
             "Tip: Use 0 if you want continuous text without artificial breaks."
         )
-        messagebox.showinfo("Characters Per Line Help", help_text, parent=self.frame)
+        self._show_help("Characters Per Line Help", help_text)
     
     def show_timestamp_help(self):
         """Show help dialog for timestamp feature."""
@@ -433,7 +719,34 @@ class SingleFileTab:
             "  • Create timestamped notes\n\n"
             "Note: Timestamps are disabled by default."
         )
-        messagebox.showinfo("Timestamp Help", help_text, parent=self.frame)
+        self._show_help("Timestamp Help", help_text)
+    
+    def _show_help(self, title, help_text):
+        """Show a help window, reusing it if it was opened before.
+        
+        Args:
+            title: Window title, also the cache key.
+            help_text: Help text to display.
+        """
+        win = self._help_windows.get(title)
+        if win is None:
+            win = tk.Toplevel(self.frame)
+            win.title(title)
+            win.transient(self.frame.winfo_toplevel())
+            win.resizable(False, False)
+            win.protocol("WM_DELETE_WINDOW", win.withdraw)
+            
+            body = ttk.Frame(win, padding="15")
+            body.grid(row=0, column=0, sticky="nsew")
+            ttk.Label(body, text=help_text, justify="left").grid(row=0, column=0, sticky="w")
+            ttk.Button(body, text="OK", command=win.withdraw).grid(row=1, column=0, pady=(15, 0))
+            
+            self._help_windows[title] = win
+        else:
+            win.deiconify()
+        
+        win.lift()
+        win.focus_set()
     
     def get_config(self):
         """Get tab configuration."""
@@ -449,9 +762,15 @@ class SingleFileTab:
     def set_config(self, config):
         """Set tab configuration."""
         if config.get('file_path'):
-            self.file_path = config['file_path']
-            if os.path.exists(self.file_path):
-                self.file_label.config(text=self.file_path, foreground="black")
+            path = config['file_path']
+            # One stat both confirms the file still exists and caches its size
+            try:
+                file_size = os.path.getsize(path) / (1024 * 1024)
+            except OSError:
+                file_size = None
+            self._set_file_path(path, file_size)
+            if file_size is not None:
+                self.file_label.config(text=path, foreground="black")
                 self.transcribe_btn.config(state="normal")
         
         if 'detect_date' in config:
@@ -1,7 +1,27 @@
 """Utilities package for Audio Transcriber."""
-from .file_utils import FileUtils
-from .format_utils import FormatUtils
-from .date_parser import DateParser
-from .audio_utils import AudioUtils
+import importlib
 
-__all__ = ['FileUtils', 'FormatUtils', 'DateParser', 'AudioUtils']
+# Exported name -> submodule, imported on first access (PEP 562) so that
+# importing one utility module does not pull in all the others
+_LAZY = {
+    'FileUtils': 'file_utils',
+    'FormatUtils': 'format_utils',
+    'DateParser': 'date_parser',
+    'AudioUtils': 'audio_utils',
+    'AudioInfo': 'audio_utils',
+}
+
+__all__ = ['FileUtils', 'FormatUtils', 'DateParser', 'AudioUtils', 'AudioInfo']
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module('.' + _LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
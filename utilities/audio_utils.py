@@ -1,9 +1,60 @@
 """Audio utilities for Audio Transcriber."""
+from collections import namedtuple
+
+# Display strings for a file's audio metadata; fields are None when there is nothing to show
+AudioInfo = namedtuple('AudioInfo', 'summary mp3_tags')
+
+
+def _fmt_channels(channels):
+    """Describe a channel count."""
+    if channels == 1:
+        return "Mono"
+    if channels == 2:
+        return "Stereo"
+    return f"{channels} channels"
+
+
+def _fmt_sample_rate(sample_rate):
+    """Describe a sample rate in Hz or kHz."""
+    if sample_rate >= 1000:
+        return f"{sample_rate / 1000:.1f}kHz"
+    return f"{sample_rate}Hz"
+
+
+# (metadata key, formatter) in display order for format_audio_info
+_AUDIO_FIELDS = (
+    ('channels', _fmt_channels),
+    ('sample_rate', _fmt_sample_rate),
+    ('bitrate', lambda bitrate: f"{bitrate}kbps"),
+)
+
+# (metadata key, label) in display order for format_mp3_tags
+_TAG_FIELDS = (
+    ('artist', 'Artist'),
+    ('album', 'Album'),
+    ('title', 'Title'),
+)
 
 
 class AudioUtils:
     """Utilities for audio metadata formatting."""
     
+    @staticmethod
+    def build(metadata):
+        """Format all displayable audio metadata in one pass.
+        
+        Args:
+            metadata: Dictionary of audio metadata.
+            
+        Returns:
+            AudioInfo with the format summary and MP3 tags strings.
+        """
+        summary = AudioUtils.format_audio_info(metadata)
+        return AudioInfo(
+            summary if summary != "Unknown" else None,
+            AudioUtils.format_mp3_tags(metadata)
+        )
+    
     @staticmethod
     def format_audio_info(metadata):
         """Format audio metadata for display.
@@ -15,25 +66,10 @@ class AudioUtils:
             Formatted audio info string.
         """
         info = []
-        
-        # Audio format details
-        if metadata.get('channels'):
-            if metadata['channels'] == 1:
-                info.append("Mono")
-            elif metadata['channels'] == 2:
-                info.append("Stereo")
-            else:
-                info.append(f"{metadata['channels']} channels")
-        
-        if metadata.get('sample_rate'):
-            sample_rate = metadata['sample_rate']
-            if sample_rate >= 1000:
-                info.append(f"{sample_rate / 1000:.1f}kHz")
-            else:
-                info.append(f"{sample_rate}Hz")
-        
-        if metadata.get('bitrate'):
-            info.append(f"{metadata['bitrate']}kbps")
+        for key, fmt in _AUDIO_FIELDS:
+            value = metadata.get(key)
+            if value:
+                info.append(fmt(value))
         
         return " / ".join(info) if info else "Unknown"
     
@@ -47,15 +83,6 @@ class AudioUtils:
         Returns:
             Formatted MP3 tags string or None.
         """
-        tags = []
-        
-        if metadata.get('artist'):
-            tags.append(f"Artist: {metadata['artist']}")
-        
-        if metadata.get('album'):
-            tags.append(f"Album: {metadata['album']}")
-        
-        if metadata.get('title'):
-            tags.append(f"Title: {metadata['title']}")
+        tags = [f"{label}: {value}" for key, label in _TAG_FIELDS if (value := metadata.get(key))]
         
         return "\n".join(tags) if tags else None
@@ -1,8 +1,36 @@
 """Date parsing utilities for Audio Transcriber."""
+import functools
 import os
 import re
 from datetime import datetime
 
+# All filename date formats as one alternation, scanned in a single pass.
+# Each outer group names the format; its inner groups hold the date fields.
+_DATE_RE = re.compile(
+    r'(?P<ymd_sep>(\d{4})[-_.](\d{2})[-_.](\d{2}))'
+    r'|(?P<ymd>(\d{4})(\d{2})(\d{2}))'
+    r'|(?P<mdy>(\d{2})[-_.](\d{2})[-_.](\d{4}))'
+    r'|(?P<month_name>(?i:(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*)[-_.\s]+(\d{1,2})[-_.\s]+(\d{4}))',
+    # Case folding is scoped to the month name; ASCII mode keeps it to plain a-z
+    # and limits \d and \s to ASCII digits and whitespace
+    re.ASCII
+)
+
+# Order of the (year, month, day) fields within each alternative's three groups
+_FIELD_ORDER = {
+    'ymd_sep': (0, 1, 2),
+    'ymd': (0, 1, 2),
+    'mdy': (2, 0, 1),
+    'month_name': (2, 0, 1),
+}
+
+_MONTH_MAP = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+_DAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
 
 class DateParser:
     """Utilities for parsing dates from filenames."""
@@ -17,32 +45,33 @@ class DateParser:
         Returns:
             Tuple of (detected_date, day_of_week) or (None, None).
         """
-        name_without_ext = os.path.splitext(filename)[0]
+        return DateParser.detect_date_from_stem(os.path.splitext(filename)[0])
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def detect_date_from_stem(name_without_ext):
+        """Detect date from a filename with its extension already removed.
         
-        patterns = [
-            (r'(\d{4})[-_.](\d{2})[-_.](\d{2})', '%Y-%m-%d'),
-            (r'(\d{4})(\d{2})(\d{2})', '%Y%m%d'),
-            (r'(\d{2})[-_.](\d{2})[-_.](\d{4})', '%m-%d-%Y'),
-            (r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*[-_.\s]+(\d{1,2})[-_.\s]+(\d{4})', 'month_name'),
-        ]
+        Results are memoized; datetime objects are immutable, so sharing them is safe.
         
-        for pattern, date_format in patterns:
-            match = re.search(pattern, name_without_ext, re.IGNORECASE)
-            if match:
-                try:
-                    if date_format == 'month_name':
-                        month_str = match.group(1)
-                        day = int(match.group(2))
-                        year = int(match.group(3))
-                        date_str = f"{month_str} {day} {year}"
-                        detected_date = datetime.strptime(date_str, '%b %d %Y')
-                    else:
-                        date_str = '-'.join(match.groups())
-                        detected_date = datetime.strptime(date_str, date_format)
-                    
-                    day_of_week = detected_date.strftime('%A')
-                    return detected_date, day_of_week
-                except ValueError:
-                    continue
+        Args:
+            name_without_ext: Filename stem to parse.
+            
+        Returns:
+            Tuple of (detected_date, day_of_week) or (None, None).
+        """
+        for match in _DATE_RE.finditer(name_without_ext):
+            # The three date fields are the groups right after the matched outer group
+            outer = match.lastindex
+            fields = match.group(outer + 1, outer + 2, outer + 3)
+            y, m, d = _FIELD_ORDER[match.lastgroup]
+            month = fields[m]
+            month = _MONTH_MAP[month.lower()] if month.isalpha() else int(month)
+            try:
+                detected_date = datetime(int(fields[y]), month, int(fields[d]))
+            except ValueError:
+                continue
+            
+            return detected_date, _DAYS[detected_date.weekday()]
         
         return None, None
@@ -1,18 +1,40 @@
 """File utilities for Audio Transcriber."""
 import os
-from config.constants import AUDIO_EXTENSIONS
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from config.constants import AUDIO_EXTENSIONS, SKIPPED_DIRECTORIES
+
+# Lowercase extension tuple so str.endswith can test all of them in one C call
+_AUDIO_EXTS = tuple(sorted(AUDIO_EXTENSIONS))
+
+# Worker threads listing directories in parallel during recursive scans
+_SCAN_WORKERS = 8
 
 
 class FileUtils:
     """Utilities for file operations."""
     
     @staticmethod
-    def get_audio_files(folder, recursive=False):
+    def is_skipped_directory(name):
+        """Check whether a directory should be skipped during recursive scans.
+        
+        Args:
+            name: Directory name (not a full path).
+            
+        Returns:
+            True for hidden directories and known system/tool directories.
+        """
+        return name.startswith('.') or name in SKIPPED_DIRECTORIES
+    
+    @staticmethod
+    def get_audio_files(folder, recursive=False, skip_hidden=True, follow_symlinks=False):
         """Get list of audio files in a folder.
         
         Args:
             folder: Folder path to search.
             recursive: Whether to search recursively.
+            skip_hidden: Whether to skip hidden and system directories when recursing.
+            follow_symlinks: Whether to follow symlinked files and directories when
+                recursing. Directory cycles are detected by (st_dev, st_ino).
             
         Returns:
             Sorted list of audio file paths.
@@ -20,16 +42,40 @@ class FileUtils:
         audio_files = []
         
         if recursive:
-            for root, dirs, files in os.walk(folder):
-                for file in files:
-                    if os.path.splitext(file)[1].lower() in AUDIO_EXTENSIONS:
-                        audio_files.append(os.path.join(root, file))
+            visited = set()
+            if follow_symlinks:
+                try:
+                    st = os.stat(folder)
+                    visited.add((st.st_dev, st.st_ino))
+                except OSError:
+                    pass
+            
+            # Directory reads are I/O bound, so subtrees are listed on worker threads
+            # while this thread collects results and hands out newly found folders.
+            # os.fwalk's fd-relative lookups are not used: it walks on one thread,
+            # and scandir's DirEntry already supplies joined paths and file types.
+            with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+                scan = FileUtils._scan_directory
+                pending = {pool.submit(scan, folder, skip_hidden, follow_symlinks)}
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        files, subdirs = future.result()
+                        audio_files.extend(files)
+                        for path, dir_id in subdirs:
+                            if dir_id is not None:
+                                if dir_id in visited:
+                                    continue
+                                visited.add(dir_id)
+                            pending.add(pool.submit(scan, path, skip_hidden, follow_symlinks))
         else:
             try:
-                for file in os.listdir(folder):
-                    file_path = os.path.join(folder, file)
-                    if os.path.isfile(file_path) and os.path.splitext(file)[1].lower() in AUDIO_EXTENSIONS:
-                        audio_files.append(file_path)
+                # DirEntry carries the joined path and usually the file type from
+                # the directory read itself, saving a stat per entry
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.name.lower().endswith(_AUDIO_EXTS) and entry.is_file():
+                            audio_files.append(entry.path)
             except FileNotFoundError:
                 import logging
                 logging.error(f"Folder not found: {folder}")
@@ -42,6 +88,50 @@ class FileUtils:
         
         return sorted(audio_files)
     
+    @staticmethod
+    def _scan_directory(path, skip_hidden, follow_symlinks):
+        """List one directory for get_audio_files' recursive scan.
+        
+        Args:
+            path: Directory to list.
+            skip_hidden: Whether to leave out hidden and system subdirectories.
+            follow_symlinks: Whether to follow symlinked files and directories.
+            
+        Returns:
+            Tuple of (audio file paths, [(subdirectory path, dir_id)]). dir_id is
+            (st_dev, st_ino) when following symlinks, otherwise None.
+        """
+        files = []
+        subdirs = []
+        is_skipped = FileUtils.is_skipped_directory
+        exts = _AUDIO_EXTS
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=follow_symlinks):
+                        if skip_hidden and is_skipped(name):
+                            continue
+                        dir_id = None
+                        if follow_symlinks:
+                            # DirEntry.stat() has no inode on Windows, so stat the path;
+                            # one unreadable or vanished directory must not end the listing
+                            try:
+                                st = os.stat(entry.path)
+                            except OSError as e:
+                                import logging
+                                logging.debug(f"Skipping unreadable folder {entry.path}: {e}")
+                                continue
+                            dir_id = (st.st_dev, st.st_ino)
+                        subdirs.append((entry.path, dir_id))
+                    elif name.lower().endswith(exts) and \
+                            entry.is_file(follow_symlinks=follow_symlinks):
+                        files.append(entry.path)
+        except OSError as e:
+            import logging
+            logging.debug(f"Skipping unreadable folder {path}: {e}")
+        return files, subdirs
+    
     @staticmethod
     def get_relative_path(file_path, base_folder):
         """Get relative path from base folder.
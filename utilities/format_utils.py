@@ -1,11 +1,36 @@
 """Formatting utilities for Audio Transcriber."""
-from config.constants import SECONDS_PER_MINUTE, SECONDS_PER_HOUR, BYTES_PER_KB, BYTES_PER_MB
+import functools
+from operator import itemgetter
+from config.constants import SECONDS_PER_MINUTE, SECONDS_PER_HOUR, BYTES_PER_KB, BYTES_PER_MB, BYTES_PER_GB
+
+# Zero-padded field strings for timecode timestamps, concatenated instead of formatted
+_TWO_DIGIT = tuple(f"{i:02d}" for i in range(100))
+_THREE_DIGIT = tuple(f"{i:03d}" for i in range(1000))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_whole_timestamp(total_secs, format_type):
+    """Format a whole number of seconds for FormatUtils.format_timestamp.
+    
+    Args:
+        total_secs: Time in whole seconds.
+        format_type: 'HH:MM:SS' or 'MM:SS'; anything else formats as HH:MM:SS.
+        
+    Returns:
+        Formatted timestamp string.
+    """
+    total_minutes, secs = divmod(total_secs, SECONDS_PER_MINUTE)
+    if format_type == 'MM:SS':
+        return f"[{total_minutes:02d}:{secs:02d}]"
+    hours, minutes = divmod(total_minutes, SECONDS_PER_MINUTE)
+    return f"[{hours:02d}:{minutes:02d}:{secs:02d}]"
 
 
 class FormatUtils:
     """Utilities for text and time formatting."""
     
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def format_time(seconds):
         """Format time in seconds to human-readable format.
         
@@ -17,17 +42,26 @@ class FormatUtils:
         """
         if seconds == 0:
             return "0s"
-        elif seconds < SECONDS_PER_MINUTE:
+        
+        # Whole seconds: integer divmod instead of float modulo, same output
+        if type(seconds) is int or (type(seconds) is float and seconds.is_integer()):
+            whole = int(seconds)
+            if whole < SECONDS_PER_MINUTE:
+                return f"{whole}.0s"
+            minutes, secs = divmod(whole, SECONDS_PER_MINUTE)
+            if whole < SECONDS_PER_HOUR:
+                return f"{minutes}m {secs}.0s"
+            hours, minutes = divmod(minutes, SECONDS_PER_MINUTE)
+            return f"{hours}h {minutes}m {secs}s"
+        
+        if seconds < SECONDS_PER_MINUTE:
             return f"{seconds:.1f}s"
-        elif seconds < SECONDS_PER_HOUR:
-            minutes = int(seconds // SECONDS_PER_MINUTE)
-            secs = seconds % SECONDS_PER_MINUTE
-            return f"{minutes}m {secs:.1f}s"
-        else:
-            hours = int(seconds // SECONDS_PER_HOUR)
-            minutes = int((seconds % SECONDS_PER_HOUR) // SECONDS_PER_MINUTE)
-            secs = seconds % SECONDS_PER_MINUTE
-            return f"{hours}h {minutes}m {secs:.0f}s"
+        # One divmod per unit instead of separate floor-divide and modulo
+        minutes, secs = divmod(seconds, SECONDS_PER_MINUTE)
+        if seconds < SECONDS_PER_HOUR:
+            return f"{int(minutes)}m {secs:.1f}s"
+        hours, minutes = divmod(int(minutes), SECONDS_PER_MINUTE)
+        return f"{hours}h {minutes}m {secs:.0f}s"
     
     @staticmethod
     def format_text_with_line_breaks(text, max_chars=80):
@@ -51,34 +85,34 @@ class FormatUtils:
         if max_chars == 0:
             return text
             
-        paragraphs = text.split('\n')
-        formatted = []
-        
-        for para in paragraphs:
-            if not para.strip():
-                formatted.append("")
-                continue
-                
+        # Greedy fill over str.split() words: each word either extends the current
+        # line or starts a new one, and an over-long word gets a line to itself.
+        # Finding line breaks by searching cumulative word lengths (NumPy
+        # searchsorted or bisect) measured slower than this loop on long paragraphs.
+        lines = []
+        add_line = lines.append
+        # split('\n') rather than splitlines(): a trailing newline must keep its empty
+        # line, and \r, \f or \u2028 inside a paragraph are collapsed like spaces
+        for para in text.split('\n'):
             words = para.split()
-            lines = []
-            current_line = ""
-            
+            # Paragraphs that already fit need only the whitespace-normalizing join
+            joined = ' '.join(words)
+            if len(joined) <= max_chars:
+                add_line(joined)
+                continue
+            line = []
+            line_len = -1
             for word in words:
-                test_line = current_line + (" " if current_line else "") + word
-                if len(test_line) <= max_chars:
-                    current_line = test_line
+                word_len = len(word)
+                if line and line_len + 1 + word_len > max_chars:
+                    add_line(' '.join(line))
+                    line = [word]
+                    line_len = word_len
                 else:
-                    if current_line:
-                        lines.append(current_line)
-                    current_line = word
-                    
-            # Add the last line
-            if current_line:
-                lines.append(current_line)
-                
-            formatted.append('\n'.join(lines))
-            
-        return '\n'.join(formatted)
+                    line.append(word)
+                    line_len += 1 + word_len
+            add_line(' '.join(line))
+        return '\n'.join(lines)
     
     @staticmethod
     def format_file_size(size_bytes):
@@ -90,13 +124,13 @@ class FormatUtils:
         Returns:
             Formatted size string.
         """
-        size_mb = size_bytes / BYTES_PER_MB
-        if size_mb < 1:
+        # Pick the unit by comparing bytes, dividing only for the unit shown
+        if size_bytes < BYTES_PER_MB:
             return f"{size_bytes / BYTES_PER_KB:.1f} KB"
-        elif size_mb < 1024:
-            return f"{size_mb:.1f} MB"
+        elif size_bytes < BYTES_PER_GB:
+            return f"{size_bytes / BYTES_PER_MB:.1f} MB"
         else:
-            return f"{size_mb / 1024:.1f} GB"
+            return f"{size_bytes / BYTES_PER_GB:.1f} GB"
     
     @staticmethod
     def format_timestamp(seconds, format_type='HH:MM:SS'):
@@ -109,6 +143,10 @@ class FormatUtils:
         Returns:
             Formatted timestamp string.
         """
+        # Interval timestamps are whole seconds and repeat across transcripts
+        if format_type != 'timecode' and seconds == int(seconds):
+            return _format_whole_timestamp(int(seconds), format_type)
+        
         hours = int(seconds // SECONDS_PER_HOUR)
         minutes = int((seconds % SECONDS_PER_HOUR) // SECONDS_PER_MINUTE)
         secs = int(seconds % SECONDS_PER_MINUTE)
@@ -120,6 +158,9 @@ class FormatUtils:
             total_minutes = int(seconds // SECONDS_PER_MINUTE)
             return f"[{total_minutes:02d}:{secs:02d}]"
         elif format_type == 'timecode':
+            if 0 <= hours < 100:
+                return ("[" + _TWO_DIGIT[hours] + ":" + _TWO_DIGIT[minutes] + ":" +
+                        _TWO_DIGIT[secs] + "." + _THREE_DIGIT[millis] + "]")
             return f"[{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}]"
         else:
             # Default to HH:MM:SS
@@ -140,17 +181,28 @@ class FormatUtils:
         if not segments:
             return ""
         
-        # Start with timestamp at 0
+        # Bind the per-interval calls to locals for the loops below
+        fmt = FormatUtils.format_timestamp
+        get_fields = itemgetter('start', 'text')
         result = []
-        result.append(FormatUtils.format_timestamp(0, format_type))
+        append = result.append
+        
+        # Start with timestamp at 0
+        append(fmt(0, format_type))
         
         current_interval = interval_seconds
+        # One window buffer, cleared between timestamps so its append can stay bound
         current_text = []
+        add_text = current_text.append
         
         for segment in segments:
-            segment_start = segment.get('start', 0)
-            segment_end = segment.get('end', 0)
-            segment_text = segment.get('text', '').strip()
+            # The transcriber always fills both keys; fall back for partial dicts
+            try:
+                segment_start, segment_text = get_fields(segment)
+            except KeyError:
+                segment_start = segment.get('start', 0)
+                segment_text = segment.get('text', '')
+            segment_text = segment_text.strip()
             
             if not segment_text:
                 continue
@@ -159,20 +211,20 @@ class FormatUtils:
             if segment_start >= current_interval:
                 # Add accumulated text before timestamp
                 if current_text:
-                    result.append(' '.join(current_text))
-                    current_text = []
+                    append(' '.join(current_text))
+                    current_text.clear()
                 
                 # Insert timestamp(s) for all passed intervals
                 while current_interval <= segment_start:
-                    result.append(FormatUtils.format_timestamp(current_interval, format_type))
+                    append(fmt(current_interval, format_type))
                     current_interval += interval_seconds
             
             # Add segment text
-            current_text.append(segment_text)
+            add_text(segment_text)
         
         # Add any remaining text
         if current_text:
-            result.append(' '.join(current_text))
+            append(' '.join(current_text))
         
         # Join with newlines so each timestamp is on its own line
         return '\n'.join(result)
@@ -2,12 +2,36 @@
 Verify Requirements Script
 Checks and reports on all required and optional dependencies for Audio Transcriber.
 """
+import os
+import re
 import sys
 import json
 import argparse
+import contextlib
+import functools
+import hashlib
+import io
+import sysconfig
+import time
+from concurrent.futures import ThreadPoolExecutor
 from importlib import import_module
 from importlib.metadata import version, PackageNotFoundError
-from config.constants import STATUS_SUCCESS, STATUS_ERROR, STATUS_WARNING
+from importlib.util import find_spec
+from config.constants import STATUS_SUCCESS, STATUS_ERROR, STATUS_WARNING, STATUS_SKIPPED
+
+
+# ASCII stand-ins for status emoji, applied in one pass when the console can't encode them
+_ASCII_STATUS = {
+    STATUS_SUCCESS: "[OK]",
+    STATUS_ERROR: "[FAIL]",
+    STATUS_WARNING: "[WARN]",
+    STATUS_SKIPPED: "[SKIP]",
+}
+_ASCII_STATUS_RE = re.compile('|'.join(map(re.escape, _ASCII_STATUS)))
+
+# Rule line around the report banner and section titles
+_SEPARATOR = '=' * 70
+_SECTION_HEADER = f"\n{_SEPARATOR}\n  {{}}\n{_SEPARATOR}"
 
 
 def safe_print(*args, **kwargs):
@@ -21,14 +45,7 @@ def safe_print(*args, **kwargs):
     except UnicodeEncodeError:
         # Replace emoji with ASCII-safe alternatives
         line = str(args[0]) if args else ""
-        replacements = {
-            "✅": "[OK]",
-            "❌": "[FAIL]",
-            "⚠️": "[WARN]",
-            "⏭️": "[SKIP]"
-        }
-        for emoji, replacement in replacements.items():
-            line = line.replace(emoji, replacement)
+        line = _ASCII_STATUS_RE.sub(lambda m: _ASCII_STATUS[m.group()], line)
         
         # Try printing again with replacements
         if args:
@@ -40,6 +57,18 @@ def safe_print(*args, **kwargs):
 # ============================================================================
 # Package Configuration
 # ============================================================================
+# Threads running the independent checks in main(); they wait on imports and subprocesses
+CHECK_WORKERS = 8
+
+# Bits set by check_python_version for each interpreter check that passed
+COMPAT_VERSION = 1 << 0
+COMPAT_PIP = 1 << 1
+COMPAT_SETUPTOOLS = 1 << 2
+
+# Where --json reports are reused from, and for how long by default (seconds)
+CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'audio_transcriber', 'verify.json')
+DEFAULT_CACHE_TTL = 600
+
 PACKAGES_CONFIG = {
     'core': [
         ('torch', 'torch', False),
@@ -63,6 +92,29 @@ PACKAGES_CONFIG = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def dist_version(dist_name):
+    """
+    Look up an installed distribution's version, once per name.
+    
+    Targeted lookups are used instead of indexing importlib.metadata.distributions(),
+    which parses the metadata of every installed package.
+    
+    Args:
+        dist_name: Distribution name as listed in pip
+        
+    Returns:
+        Version string, or None if no metadata is found or it cannot be read
+    """
+    try:
+        return version(dist_name)
+    except PackageNotFoundError:
+        return None
+    except Exception:
+        # Unreadable metadata counts as not installed, as it did for the pip check
+        return None
+
+
 def check_python_version(min_major=3, min_minor=9):
     """
     Check Python version compatibility.
@@ -72,52 +124,101 @@ def check_python_version(min_major=3, min_minor=9):
         min_minor: Minimum minor version
         
     Returns:
-        Dictionary with version check results
+        Tuple of (COMPAT_* bit flags that passed, dictionary with version check results)
     """
+    flags = 0
+    if sys.version_info >= (min_major, min_minor):
+        flags |= COMPAT_VERSION
+    tool_versions = {}
+    for tool, flag in (('pip', COMPAT_PIP), ('setuptools', COMPAT_SETUPTOOLS)):
+        tool_version = dist_version(tool)
+        if tool_version is not None:
+            flags |= flag
+            tool_versions[f'{tool}_version'] = tool_version
+    
     result = {
         'current': f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
         'minimum': f"{min_major}.{min_minor}",
-        'compatible': True,
-        'checks': {}
+        'compatible': bool(flags & COMPAT_VERSION),
+        'checks': {
+            'version': bool(flags & COMPAT_VERSION),
+            'pip': bool(flags & COMPAT_PIP),
+            'setuptools': bool(flags & COMPAT_SETUPTOOLS),
+        }
     }
+    result.update(tool_versions)
     
-    # Check Python version
-    if sys.version_info < (min_major, min_minor):
-        result['compatible'] = False
-        result['checks']['version'] = False
-    else:
-        result['checks']['version'] = True
+    return flags, result
+
+
+def probe_module(module_name, deep=False):
+    """
+    Check that a module can be found, without running it unless deep is set.
     
-    # Check pip
+    Args:
+        module_name: Module name, dotted for submodules (parents are imported)
+        deep: Whether to actually import the module
+        
+    Raises:
+        ImportError: If the module cannot be found or imported
+    """
+    # Modules the calling process already imported need no lookup; a None entry
+    # marks a blocked import and falls through to raise below
+    if sys.modules.get(module_name) is not None:
+        return
+    if deep:
+        import_module(module_name)
+        return
+    # No site-packages listing as a pre-filter: PathFinder already caches each
+    # sys.path directory's contents, so a miss costs about as much as the scan,
+    # and a listing of one directory misses user-site, .pth and editable installs
     try:
-        from importlib.metadata import version as get_version
-        pip_version = get_version('pip')
-        result['checks']['pip'] = True
-        result['pip_version'] = pip_version
-    except Exception:
-        result['checks']['pip'] = False
+        spec = find_spec(module_name)
+    except ValueError:
+        # Already imported with no __spec__ set, so it is present
+        return
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{module_name}'")
+
+
+@functools.lru_cache(maxsize=128)
+def probe_import(module_name, deep=False):
+    """
+    Probe a module once per process and describe the outcome.
     
-    # Check setuptools
-    try:
-        from importlib.metadata import version as get_version
-        setuptools_version = get_version('setuptools')
-        result['checks']['setuptools'] = True
-        result['setuptools_version'] = setuptools_version
-    except Exception:
-        result['checks']['setuptools'] = False
+    Modules checked both as a package and as a submodule (pydub, faster_whisper)
+    share one probe.
     
-    return result
+    Args:
+        module_name: Module name, dotted for submodules
+        deep: Whether to actually import the module
+        
+    Returns:
+        Tuple of (importable, error, detail); error is the message to report and
+        detail the raw exception text, both None when importable
+    """
+    try:
+        probe_module(module_name, deep)
+    except ImportError as e:
+        return False, f'Import error: {e}', str(e)
+    except Exception as e:
+        return False, f'Unexpected error: {e}', str(e)
+    return True, None, None
 
 
-def check_package(package_name, import_name=None, optional=False, verbose=False):
+@functools.lru_cache(maxsize=64)
+def check_package(package_name, import_name=None, optional=False, verbose=False, deep=False):
     """
     Check if a package is installed and importable.
     
+    Results are memoized per argument set; treat the returned dictionary as read-only.
+    
     Args:
         package_name: Package name as listed in pip
         import_name: Module name to import (if different from package_name)
         optional: Whether the package is optional
         verbose: Whether to show detailed error information
+        deep: Whether to actually import the module instead of only locating it
         
     Returns:
         Dictionary with status information
@@ -125,6 +226,8 @@ def check_package(package_name, import_name=None, optional=False, verbose=False)
     if import_name is None:
         import_name = package_name
     
+    # A plain dict is the JSON record as-is; every key is always present so
+    # --json consumers see a fixed schema, verbose or not
     result = {
         'package': package_name,
         'import_name': import_name,
@@ -137,44 +240,43 @@ def check_package(package_name, import_name=None, optional=False, verbose=False)
     }
     
     # Check if installed via package metadata
-    try:
-        pkg_version = version(package_name)
+    pkg_version = dist_version(package_name)
+    if pkg_version is not None:
         result['installed'] = True
         result['version'] = pkg_version
-    except PackageNotFoundError:
+    else:
         result['error'] = 'No package metadata found'
     
-    # Check if importable
-    try:
-        import_module(import_name)
+    # Check if importable; locating the module's spec avoids running heavy
+    # package imports such as torch unless a deep check is requested
+    importable, error, detail = probe_import(import_name, deep)
+    if importable:
         result['importable'] = True
         # If importable but no version, it's a built-in module
         if not result['installed']:
             result['installed'] = True
             result['version'] = 'Built-in'
             result['error'] = None
-    except ImportError as e:
-        error_msg = str(e)
-        result['error'] = f'Import error: {error_msg}'
-        if verbose:
-            result['trace'] = error_msg
-    except Exception as e:
-        error_msg = str(e)
-        result['error'] = f'Unexpected error: {error_msg}'
+    else:
+        result['error'] = error
         if verbose:
-            result['trace'] = error_msg
+            result['trace'] = detail
     
     return result
 
 
-def check_submodule(module_path, description, verbose=False):
+@functools.lru_cache(maxsize=64)
+def check_submodule(module_path, description, verbose=False, deep=False):
     """
     Check if a specific submodule is importable.
     
+    Results are memoized per argument set; treat the returned dictionary as read-only.
+    
     Args:
         module_path: Full module path (e.g., 'mutagen.id3')
         description: Human-readable description
         verbose: Whether to show detailed error information
+        deep: Whether to actually import the module instead of only locating it
         
     Returns:
         Dictionary with status information
@@ -187,25 +289,35 @@ def check_submodule(module_path, description, verbose=False):
         'trace': None
     }
     
-    try:
-        import_module(module_path)
+    importable, error, detail = probe_import(module_path, deep)
+    if importable:
         result['importable'] = True
-    except ImportError as e:
-        error_msg = str(e)
-        result['error'] = f'Import error: {error_msg}'
-        if verbose:
-            result['trace'] = error_msg
-    except Exception as e:
-        error_msg = str(e)
-        result['error'] = f'Unexpected error: {error_msg}'
+    else:
+        result['error'] = error
         if verbose:
-            result['trace'] = error_msg
+            result['trace'] = detail
     
     return result
 
 
-def check_gpu_support():
-    """Check GPU/CUDA availability."""
+def check_gpu_support(deep=False):
+    """
+    Check GPU/CUDA availability.
+    
+    Availability is always decided by torch.cuda.is_available(), as in the app.
+    When torch is not imported yet, a missing NVIDIA driver (no nvidia-smi) or a
+    '+cpu' torch build rules the GPU out without loading torch and the CUDA
+    libraries. nvidia-smi also supplies the device name and memory; torch is only
+    asked for those on a deep check, since they initialize CUDA.
+    
+    Args:
+        deep: Whether to query the device name and memory through torch.cuda
+        
+    Returns:
+        Dictionary with GPU status
+    """
+    import shutil
+    import subprocess
     result = {
         'available': False,
         'device_name': None,
@@ -214,50 +326,104 @@ def check_gpu_support():
         'error': None
     }
     
+    if not probe_import('torch')[0]:
+        result['error'] = 'torch not installed'
+        return result
+    if os.environ.get('CUDA_VISIBLE_DEVICES') == '':
+        result['error'] = 'CUDA disabled (CUDA_VISIBLE_DEVICES is empty)'
+        return result
+    
+    smi = shutil.which('nvidia-smi')
+    # Importing torch loads the CUDA libraries; skip it when the GPU is ruled out anyway
+    if 'torch' not in sys.modules and not deep:
+        if smi is None:
+            result['error'] = 'No NVIDIA driver found (nvidia-smi not in PATH)'
+            return result
+        if (dist_version('torch') or '').partition('+')[2] == 'cpu':
+            result['error'] = 'torch is a CPU-only build (reinstall a CUDA build of torch)'
+            return result
+    
+    if smi is not None and not deep:
+        try:
+            output = subprocess.run(
+                [smi, '--query-gpu=name,memory.total', '--format=csv,noheader,nounits'],
+                capture_output=True,
+                text=True,
+                timeout=2
+            )
+            first_line = output.stdout.partition('\n')[0]
+            if output.returncode == 0 and first_line:
+                name, memory_mib = first_line.rsplit(',', 1)
+                result['device_name'] = name.strip()
+                result['memory_gb'] = round(float(memory_mib) / 1024, 1)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            pass
+    
     try:
         import torch
         result['available'] = torch.cuda.is_available()
+        if not result['available'] and result['device_name']:
+            result['error'] = 'NVIDIA GPU found, but torch cannot use CUDA with it'
         
         if result['available']:
-            result['device_name'] = torch.cuda.get_device_name(0)
-            memory = torch.cuda.get_device_properties(0).total_memory / (1024**3)
-            result['memory_gb'] = round(memory, 1)
             result['cuda_version'] = torch.version.cuda
+            if deep:
+                result['device_name'] = torch.cuda.get_device_name(0)
+                memory = torch.cuda.get_device_properties(0).total_memory / (1024**3)
+                result['memory_gb'] = round(memory, 1)
     except Exception as e:
         result['error'] = str(e)
     
     return result
 
 
-def check_ffmpeg(verbose=False):
+@functools.lru_cache(maxsize=None)
+def check_ffmpeg(verbose=False, query_version=True):
     """
     Check if FFmpeg is available.
     
+    Results are memoized per argument set; treat the returned dictionary as read-only.
+    
     Args:
         verbose: Whether to show detailed error information
+        query_version: Whether to run ffmpeg -version for the version string; when
+            False, finding the executable on PATH counts as available
         
     Returns:
         Dictionary with FFmpeg status
     """
+    import shutil
     import subprocess
     result = {
         'available': False,
+        'path': None,
         'version': None,
         'error': None,
         'trace': None
     }
     
+    # A PATH lookup is enough to rule FFmpeg out without spawning a process
+    exe = shutil.which('ffmpeg')
+    if exe is None:
+        result['error'] = 'FFmpeg not found in PATH'
+        return result
+    result['path'] = exe
+    if not query_version:
+        result['available'] = True
+        return result
+    
     try:
         output = subprocess.run(
-            ['ffmpeg', '-version'],
-            capture_output=True,
+            [exe, '-version'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,  # only the first stdout line is used
             text=True,
             timeout=5
         )
         if output.returncode == 0:
             result['available'] = True
             # Extract version from first line
-            first_line = output.stdout.split('\n')[0]
+            first_line, _, _ = output.stdout.partition('\n')
             result['version'] = first_line
     except FileNotFoundError:
         result['error'] = 'FFmpeg not found in PATH'
@@ -275,9 +441,10 @@ def check_ffmpeg(verbose=False):
 class PackageFormatter:
     """Handles formatting and output of package status information."""
     
-    def __init__(self, json_output=False, verbose=False):
+    def __init__(self, json_output=False, verbose=False, compact_json=False):
         self.json_output = json_output
         self.verbose = verbose
+        self.compact_json = compact_json
         self.json_data = {
             'summary': {},
             'python': {},
@@ -287,155 +454,356 @@ class PackageFormatter:
             'ffmpeg': {}
         }
     
+    def dump_json(self):
+        """Serialize json_data, indented or with compact separators."""
+        if self.compact_json:
+            return json.dumps(self.json_data, separators=(',', ':'))
+        return json.dumps(self.json_data, indent=2)
+    
     @staticmethod
     def print_section(title):
         """Print a section header."""
-        safe_print(f"\n{'=' * 70}")
-        safe_print(f"  {title}")
-        safe_print('=' * 70)
+        safe_print(_SECTION_HEADER.format(title))
     
     def print_package_status(self, pkg_info):
         """Print status for a single package."""
         if self.json_output:
             return  # Handled in JSON output
         
+        lines = []
         status_icon = STATUS_SUCCESS if pkg_info['importable'] else STATUS_ERROR
         optional_tag = ' [OPTIONAL]' if pkg_info['optional'] else ''
         
-        safe_print(f"\n{status_icon} {pkg_info['package']}{optional_tag}")
-        safe_print(f"   Import Name: {pkg_info['import_name']}")
+        lines.append(f"\n{status_icon} {pkg_info['package']}{optional_tag}")
+        lines.append(f"   Import Name: {pkg_info['import_name']}")
         
         if pkg_info['installed']:
-            safe_print(f"   Version: {pkg_info['version']}")
+            lines.append(f"   Version: {pkg_info['version']}")
             if pkg_info['importable']:
-                safe_print(f"   Status: {STATUS_SUCCESS} Installed and importable")
+                lines.append(f"   Status: {STATUS_SUCCESS} Installed and importable")
             else:
-                safe_print(f"   Status: {STATUS_WARNING} Installed but cannot import")
+                lines.append(f"   Status: {STATUS_WARNING} Installed but cannot import")
                 if pkg_info['error']:
-                    safe_print(f"   Error: {pkg_info['error']}")
+                    lines.append(f"   Error: {pkg_info['error']}")
                     if self.verbose and pkg_info.get('trace'):
-                        safe_print(f"   Trace: {pkg_info['trace']}")
+                        lines.append(f"   Trace: {pkg_info['trace']}")
         else:
-            safe_print(f"   Status: {STATUS_ERROR} Not installed")
+            lines.append(f"   Status: {STATUS_ERROR} Not installed")
             if pkg_info['error']:
-                safe_print(f"   Error: {pkg_info['error']}")
+                lines.append(f"   Error: {pkg_info['error']}")
                 if self.verbose and pkg_info.get('trace'):
-                    safe_print(f"   Trace: {pkg_info['trace']}")
+                    lines.append(f"   Trace: {pkg_info['trace']}")
+        
+        safe_print('\n'.join(lines))
     
     def print_submodule_status(self, sub_info):
         """Print status for a submodule."""
         if self.json_output:
             return  # Handled in JSON output
         
+        lines = []
         status_icon = STATUS_SUCCESS if sub_info['importable'] else STATUS_ERROR
-        safe_print(f"\n{status_icon} {sub_info['module']} - {sub_info['description']}")
+        lines.append(f"\n{status_icon} {sub_info['module']} - {sub_info['description']}")
         if not sub_info['importable'] and sub_info['error']:
-            safe_print(f"   Error: {sub_info['error']}")
+            lines.append(f"   Error: {sub_info['error']}")
             if self.verbose and sub_info.get('trace'):
-                safe_print(f"   Trace: {sub_info['trace']}")
+                lines.append(f"   Trace: {sub_info['trace']}")
+        
+        safe_print('\n'.join(lines))
     
     def print_python_status(self, py_info):
         """Print Python version status."""
         if self.json_output:
             return  # Handled in JSON output
         
+        lines = []
         status_icon = STATUS_SUCCESS if py_info['compatible'] else STATUS_ERROR
-        safe_print(f"\n{status_icon} Python {py_info['current']}")
-        safe_print(f"   Required: {py_info['minimum']}+")
-        safe_print(f"   Compatible: {STATUS_SUCCESS if py_info['compatible'] else STATUS_ERROR}")
+        lines.append(f"\n{status_icon} Python {py_info['current']}")
+        lines.append(f"   Required: {py_info['minimum']}+")
+        lines.append(f"   Compatible: {STATUS_SUCCESS if py_info['compatible'] else STATUS_ERROR}")
         
         if py_info['checks'].get('pip'):
-            safe_print(f"   Pip: {STATUS_SUCCESS} {py_info.get('pip_version', 'installed')}")
+            lines.append(f"   Pip: {STATUS_SUCCESS} {py_info.get('pip_version', 'installed')}")
         else:
-            safe_print(f"   Pip: {STATUS_ERROR} Not available")
+            lines.append(f"   Pip: {STATUS_ERROR} Not available")
         
         if py_info['checks'].get('setuptools'):
-            safe_print(f"   Setuptools: {STATUS_SUCCESS} {py_info.get('setuptools_version', 'installed')}")
+            lines.append(f"   Setuptools: {STATUS_SUCCESS} {py_info.get('setuptools_version', 'installed')}")
         else:
-            safe_print(f"   Setuptools: {STATUS_WARNING} Not available")
+            lines.append(f"   Setuptools: {STATUS_WARNING} Not available")
+        
+        safe_print('\n'.join(lines))
 
 
 def print_section(title):
     """Print a section header."""
-    safe_print(f"\n{'=' * 70}")
-    safe_print(f"  {title}")
-    safe_print('=' * 70)
+    safe_print(_SECTION_HEADER.format(title))
+
+
+# Command-line interface, built once so repeated main() calls only parse
+_PARSER = argparse.ArgumentParser(
+    description='Verify Audio Transcriber requirements and dependencies'
+)
+_PARSER.add_argument(
+    '--json',
+    action='store_true',
+    dest='json_output',
+    help='Output results as JSON for programmatic parsing'
+)
+_PARSER.add_argument(
+    '--compact-json',
+    action='store_true',
+    help='Like --json, but without indentation or spaces (smaller output for CI parsers)'
+)
+_PARSER.add_argument(
+    '--verbose',
+    action='store_true',
+    help='Show detailed error traces and full import information'
+)
+_PARSER.add_argument(
+    '--deep',
+    action='store_true',
+    help='Import every package instead of only locating it, and query the GPU through '
+         'torch instead of nvidia-smi, to detect broken installs'
+)
+_PARSER.add_argument(
+    '--cache-ttl',
+    type=int,
+    default=DEFAULT_CACHE_TTL,
+    metavar='SECONDS',
+    help=f'Reuse a --json report from the last run for this many seconds '
+         f'(default: {DEFAULT_CACHE_TTL})'
+)
+_PARSER.add_argument(
+    '--no-cache',
+    action='store_true',
+    help='Always run every check, ignoring and not saving the cached --json report'
+)
+
+
+def report_cache_key(verbose=False, deep=False, compact_json=False):
+    """
+    Build the key a cached JSON report must match to be reused.
+    
+    Installing or removing a package changes the site-packages directory mtime,
+    which invalidates the key; GPU and FFmpeg changes are covered by the TTL.
+    
+    Args:
+        verbose: Whether the report includes error traces
+        deep: Whether the report came from importing packages
+        compact_json: Whether the report was printed without indentation
+        
+    Returns:
+        Hex digest identifying this interpreter, its packages and the report options
+    """
+    try:
+        packages_mtime = os.path.getmtime(sysconfig.get_paths()['purelib'])
+    except (OSError, KeyError):
+        packages_mtime = 0
+    raw = f"{sys.executable}\0{sys.version}\0{packages_mtime}\0{verbose}\0{deep}\0{compact_json}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def load_cached_report(key, ttl):
+    """
+    Load a cached JSON report if it matches the key and is younger than the TTL.
+    
+    Args:
+        key: Key from report_cache_key()
+        ttl: Maximum age of the cache file in seconds
+        
+    Returns:
+        Tuple of (report text, success), or None on a miss
+    """
+    try:
+        if time.time() - os.path.getmtime(CACHE_FILE) > ttl:
+            return None
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        if entry.get('key') != key:
+            return None
+        return entry['output'], entry['success']
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def save_cached_report(key, output, success):
+    """
+    Save a JSON report for later runs, replacing the cache file atomically.
+    
+    Args:
+        key: Key from report_cache_key()
+        output: Report text as printed
+        success: Whether all required packages were available
+    """
+    tmp_path = f"{CACHE_FILE}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'success': success, 'output': output}, f)
+        os.replace(tmp_path, CACHE_FILE)
+    except OSError:
+        # Caching is best effort; a read-only home directory just means no reuse
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
 
 def main(args=None):
     """Main verification function."""
-    parser = argparse.ArgumentParser(
-        description='Verify Audio Transcriber requirements and dependencies'
-    )
-    parser.add_argument(
-        '--json',
-        action='store_true',
-        dest='json_output',
-        help='Output results as JSON for programmatic parsing'
-    )
-    parser.add_argument(
-        '--verbose',
-        action='store_true',
-        help='Show detailed error traces and full import information'
-    )
-    
-    parsed_args = parser.parse_args(args)
-    json_output = parsed_args.json_output
+    parsed_args = _PARSER.parse_args(args)
+    compact_json = parsed_args.compact_json
+    json_output = parsed_args.json_output or compact_json
     verbose = parsed_args.verbose
+    deep = parsed_args.deep
+    
+    # Repeated --json runs (IDE integrations, CI) reuse the last report while the
+    # interpreter and its site-packages are unchanged
+    use_cache = json_output and not parsed_args.no_cache and parsed_args.cache_ttl > 0
+    if use_cache:
+        cache_key = report_cache_key(verbose, deep, compact_json)
+        cached = load_cached_report(cache_key, parsed_args.cache_ttl)
+        if cached is not None:
+            output, success = cached
+            safe_print(output, end='')
+            sys.stdout.flush()
+            return success
+    
+    # Collect the whole report and write it in one go instead of line by line;
+    # safe_print then applies its encoding fallback once, on the full text
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        success = run_checks(json_output, verbose, deep, compact_json)
+    output = buffer.getvalue()
+    safe_print(output, end='')
+    sys.stdout.flush()
+    
+    if use_cache:
+        save_cached_report(cache_key, output, success)
+    
+    return success
+
+
+def report_incompatible_python(formatter, py_info):
+    """
+    Print the report for an interpreter older than the minimum version.
     
-    formatter = PackageFormatter(json_output=json_output, verbose=verbose)
+    Args:
+        formatter: PackageFormatter for the requested output format
+        py_info: Result dictionary from check_python_version()
+    """
+    if formatter.json_output:
+        formatter.json_data['summary'] = {
+            'python_version': py_info['current'],
+            'python_compatible': False,
+            'all_requirements_met': False
+        }
+        formatter.json_data['python'] = py_info
+        print(formatter.dump_json())
+        return
+    
+    print_section("PYTHON ENVIRONMENT")
+    formatter.print_python_status(py_info)
+    print_section("SUMMARY")
+    safe_print(f"\n{STATUS_ERROR} Python {py_info['minimum']}+ is required; "
+               f"skipped the package, GPU and FFmpeg checks.")
+    safe_print(f"\n{_SEPARATOR}\n")
+
+
+def run_checks(json_output=False, verbose=False, deep=False, compact_json=False):
+    """
+    Run all checks and print the report.
+    
+    Args:
+        json_output: Whether to print the results as JSON
+        verbose: Whether to show detailed error information
+        deep: Whether to import packages instead of only locating them
+        compact_json: Whether to print the JSON without indentation
+        
+    Returns:
+        True if all required packages are available
+    """
+    formatter = PackageFormatter(json_output=json_output, verbose=verbose, compact_json=compact_json)
     
     if not json_output:
-        safe_print("\n" + "=" * 70)
-        safe_print("  AUDIO TRANSCRIBER - REQUIREMENTS VERIFICATION")
-        safe_print("=" * 70)
+        safe_print(_SECTION_HEADER.format("AUDIO TRANSCRIBER - REQUIREMENTS VERIFICATION"))
         safe_print(f"  Python Version: {sys.version}")
-        safe_print("=" * 70)
+        safe_print(_SEPARATOR)
+    
+    # Check Python version and tools; the rest of the report is moot on an
+    # unsupported interpreter, so stop before the package and GPU checks
+    py_flags, py_info = check_python_version()
+    if not py_flags & COMPAT_VERSION:
+        report_incompatible_python(formatter, py_info)
+        return False
+    
+    # The checks are independent and spend their time importing modules or waiting
+    # on FFmpeg, so run them all at once and report in the usual section order
+    with ThreadPoolExecutor(max_workers=CHECK_WORKERS) as executor:
+        # Slowest first (torch/CUDA load, FFmpeg process) so they never wait for a worker
+        gpu_future = executor.submit(check_gpu_support, deep=deep)
+        # The version string costs an FFmpeg process; only JSON and verbose reports show it
+        ffmpeg_future = executor.submit(check_ffmpeg, verbose=verbose,
+                                        query_version=json_output or verbose)
+        package_futures = {
+            group: [executor.submit(check_package, *pkg, verbose=verbose, deep=deep) for pkg in PACKAGES_CONFIG[group]]
+            for group in ('core', 'audio', 'builtin')
+        }
+        # Submodule entries that are also package imports (pydub, faster_whisper) are
+        # resolved below from the package's memoized probe instead of racing it here
+        package_modules = {pkg[1] for group in ('core', 'audio', 'builtin')
+                           for pkg in PACKAGES_CONFIG[group]}
+        submodule_futures = [None if sub[0] in package_modules
+                             else executor.submit(check_submodule, *sub, verbose=verbose, deep=deep)
+                             for sub in PACKAGES_CONFIG['submodules']]
     
-    # Check Python version and tools
-    py_info = check_python_version()
     if not json_output:
         print_section("PYTHON ENVIRONMENT")
         formatter.print_python_status(py_info)
     
     # Check core packages
-    core_results = [check_package(*pkg, verbose=verbose) for pkg in PACKAGES_CONFIG['core']]
+    core_results = [f.result() for f in package_futures['core']]
     if not json_output:
         print_section("CORE PACKAGES")
         for result in core_results:
             formatter.print_package_status(result)
     
     # Check audio packages
-    audio_results = [check_package(*pkg, verbose=verbose) for pkg in PACKAGES_CONFIG['audio']]
+    audio_results = [f.result() for f in package_futures['audio']]
     if not json_output:
         print_section("AUDIO PROCESSING PACKAGES")
         for result in audio_results:
             formatter.print_package_status(result)
     
     # Check built-in modules
-    builtin_results = [check_package(*pkg, verbose=verbose) for pkg in PACKAGES_CONFIG['builtin']]
+    builtin_results = [f.result() for f in package_futures['builtin']]
     if not json_output:
         print_section("BUILT-IN PYTHON MODULES")
         for result in builtin_results:
             formatter.print_package_status(result)
     
     # Check specific submodules
-    submodule_results = [check_submodule(*sub, verbose=verbose) for sub in PACKAGES_CONFIG['submodules']]
+    submodule_results = [check_submodule(*sub, verbose=verbose, deep=deep) if f is None else f.result()
+                         for f, sub in zip(submodule_futures, PACKAGES_CONFIG['submodules'])]
     if not json_output:
         print_section("SPECIFIC SUBMODULES")
         for result in submodule_results:
             formatter.print_submodule_status(result)
     
     # Check GPU support
-    gpu_info = check_gpu_support()
+    gpu_info = gpu_future.result()
     if not json_output:
         print_section("GPU / CUDA SUPPORT")
         
         if gpu_info['available']:
             safe_print(f"\n{STATUS_SUCCESS} GPU Available")
-            safe_print(f"   Device: {gpu_info['device_name']}")
-            safe_print(f"   Memory: {gpu_info['memory_gb']} GB")
-            safe_print(f"   CUDA Version: {gpu_info['cuda_version']}")
+            if gpu_info['device_name']:
+                safe_print(f"   Device: {gpu_info['device_name']}")
+            if gpu_info['memory_gb'] is not None:
+                safe_print(f"   Memory: {gpu_info['memory_gb']} GB")
+            if gpu_info['cuda_version']:
+                safe_print(f"   CUDA Version: {gpu_info['cuda_version']}")
         else:
             safe_print(f"\n{STATUS_ERROR} No GPU Detected")
             safe_print(f"   Status: CPU mode only (slower transcription)")
@@ -445,13 +813,13 @@ def main(args=None):
                     safe_print(f"   Trace: {gpu_info['trace']}")
     
     # Check FFmpeg
-    ffmpeg_info = check_ffmpeg(verbose=verbose)
+    ffmpeg_info = ffmpeg_future.result()
     if not json_output:
         print_section("EXTERNAL TOOLS")
         
         if ffmpeg_info['available']:
             safe_print(f"\n{STATUS_SUCCESS} FFmpeg Available")
-            safe_print(f"   {ffmpeg_info['version']}")
+            safe_print(f"   {ffmpeg_info['version'] or ffmpeg_info['path']}")
         else:
             safe_print(f"\n{STATUS_WARNING} FFmpeg Not Found")
             safe_print(f"   Status: Required for advanced audio format support")
@@ -464,18 +832,26 @@ def main(args=None):
             safe_print(f"   - macOS: brew install ffmpeg")
             safe_print(f"   - Linux: sudo apt-get install ffmpeg")
     
-    # Summary
+    # Summary counts for both output formats, in one pass over the package results.
+    # Counting here rather than in future done-callbacks avoids a shared lock for
+    # what is a dozen dictionary lookups once every result is in.
+    required_ok = required_total = optional_ok = optional_total = 0
+    missing_optional = []
+    for results in (core_results, audio_results, builtin_results):
+        for r in results:
+            if r['optional']:
+                optional_total += 1
+                if r['importable']:
+                    optional_ok += 1
+                else:
+                    missing_optional.append(r['package'])
+            else:
+                required_total += 1
+                if r['importable']:
+                    required_ok += 1
+    
     if json_output:
         # Build JSON output
-        all_results = core_results + audio_results + builtin_results
-        required = [r for r in all_results if not r['optional']]
-        optional = [r for r in all_results if r['optional']]
-        
-        required_ok = sum(1 for r in required if r['importable'])
-        required_total = len(required)
-        optional_ok = sum(1 for r in optional if r['importable'])
-        optional_total = len(optional)
-        
         formatter.json_data['summary'] = {
             'python_version': py_info['current'],
             'python_compatible': py_info['compatible'],
@@ -499,20 +875,11 @@ def main(args=None):
         formatter.json_data['ffmpeg'] = ffmpeg_info
         
         # Output as JSON
-        print(json.dumps(formatter.json_data, indent=2))
+        print(formatter.dump_json())
     else:
         # Print summary to console
         print_section("SUMMARY")
         
-        all_results = core_results + audio_results + builtin_results
-        required = [r for r in all_results if not r['optional']]
-        optional = [r for r in all_results if r['optional']]
-        
-        required_ok = sum(1 for r in required if r['importable'])
-        required_total = len(required)
-        optional_ok = sum(1 for r in optional if r['importable'])
-        optional_total = len(optional)
-        
         safe_print(f"\nRequired Packages: {required_ok}/{required_total} OK")
         safe_print(f"Optional Packages: {optional_ok}/{optional_total} OK")
         safe_print(f"GPU Support: {STATUS_SUCCESS + ' Yes' if gpu_info['available'] else STATUS_ERROR + ' No (CPU only)'}")
@@ -526,11 +893,10 @@ def main(args=None):
         
         if optional_ok < optional_total:
             safe_print(f"\n{STATUS_WARNING} Some optional packages are missing:")
-            for r in optional:
-                if not r['importable']:
-                    safe_print(f"   - {r['package']}")
+            for package in missing_optional:
+                safe_print(f"   - {package}")
         
-        safe_print("\n" + "=" * 70 + "\n")
+        safe_print(f"\n{_SEPARATOR}\n")
     
     return required_ok == required_total
 